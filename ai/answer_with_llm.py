@@ -1,3 +1,5 @@
+import asyncio
+
 from utils.prettify_string import prettify_string
 
 
@@ -23,3 +25,49 @@ def answer_with_llm(
         return prettify_string(completion.choices[0].message.content)
     else:
         return completion.choices[0].message.content
+
+
+async def answer_with_llm_async(
+    messages: list,
+    client,
+    model,
+    max_tokens=512,
+    prettify=True,
+    temperature=None,
+    extra_body: dict = None,
+) -> str:
+    """Same as answer_with_llm, for an AsyncOpenAI client."""
+    completion = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        extra_body=extra_body,
+    )
+
+    if prettify:
+        return prettify_string(completion.choices[0].message.content)
+    else:
+        return completion.choices[0].message.content
+
+
+def is_complete_json(response_str: str) -> bool:
+    """
+    Cheap check that a structured reply was not empty or cut off, e.g. by
+    max_tokens: a complete JSON object or array ends with "}" or "]".
+    """
+    return bool(response_str) and response_str.rstrip()[-1:] in ("}", "]")
+
+
+async def gather_with_limit(coroutines, limit: int = 8) -> list:
+    """
+    Awaits the coroutines concurrently, at most `limit` at a time, so a big
+    batch stays under the provider's rate limit. Results keep input order.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
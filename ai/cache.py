@@ -0,0 +1,94 @@
+# ai/cache.py
+import asyncio
+import hashlib
+import logging
+
+import orjson
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+logger = logging.getLogger(__name__)
+
+# LLM answers for the same prompt inputs are stable enough to reuse for a day.
+LLM_CACHE_TIMEOUT = 60 * 60 * 24
+
+# The "llm" cache alias, shared by every web and Celery process.
+llm_cache = ConnectionProxy(caches, "llm")
+
+
+def llm_cache_key(namespace: str, *parts: str) -> str:
+    """
+    Builds a cache key for an LLM result from its prompt inputs. The inputs
+    are hashed, so any lemma or phrase text yields a key every cache backend
+    accepts.
+    """
+    digest = hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+    return f"llm:{namespace}:{digest}"
+
+
+def prompt_version(*parts) -> str:
+    """
+    Digests the fixed parts of a prompt: its templates and guided_json schema.
+    Services put it in every cache key, so editing a prompt or a response
+    model stops serving answers cached for the old one.
+    """
+    data = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+# Results are cached as plain JSON data (model_dump(mode="json")) and run
+# through `validate` again on read. An entry that cannot be read or no longer
+# validates is a miss, so a stale value never breaks the caller.
+
+
+def get_cached(key: str, validate):
+    try:
+        value = llm_cache.get(key)
+        return None if value is None else validate(value)
+    except Exception as exc:
+        logger.warning("Ignoring unusable LLM cache entry %s: %s", key, exc)
+        return None
+
+
+async def aget_cached(key: str, validate):
+    try:
+        value = await llm_cache.aget(key)
+        return None if value is None else validate(value)
+    except Exception as exc:
+        logger.warning("Ignoring unusable LLM cache entry %s: %s", key, exc)
+        return None
+
+
+def get_many_cached(keys, validate) -> dict:
+    try:
+        values = llm_cache.get_many(keys)
+    except Exception as exc:
+        logger.warning("Ignoring unusable LLM cache entries: %s", exc)
+        return {}
+    results = {}
+    for key, value in values.items():
+        try:
+            results[key] = validate(value)
+        except Exception as exc:
+            logger.warning("Ignoring unusable LLM cache entry %s: %s", key, exc)
+    return results
+
+
+# Calls currently running, per event loop and cache key.
+_in_flight: dict = {}
+
+
+async def single_flight(key: str, call):
+    """
+    Awaits `call()` unless a call for the same key is already running on this
+    event loop, in which case its result is shared. Concurrent requests for the
+    same LLM result then cost a single round trip.
+    """
+    in_flight_key = (asyncio.get_running_loop(), key)
+    task = _in_flight.get(in_flight_key)
+    if task is None:
+        task = asyncio.ensure_future(call())
+        _in_flight[in_flight_key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(in_flight_key, None))
+    # Shielded, so one cancelled caller does not cancel the shared call.
+    return await asyncio.shield(task)
@@ -1,19 +1,50 @@
 # ai/client.py
 import os
-from openai import OpenAI
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 
 from config.config import Config, load_config
 
 config: Config = load_config()
 
 
-def get_client():
+BASE_URL = "https://api.studio.nebius.ai/v1/"
+CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def _get_api_key() -> str:
     # api_key = os.environ.get("NEBIUS_API_KEY") or os.environ.get("OPENAI_API_KEY")
     api_key = config.openai.nebius_key
 
     if not api_key:
         raise RuntimeError("❌ API key is not set in NEBIUS_API_KEY or OPENAI_API_KEY")
+    return api_key
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Returns the process-wide OpenAI client. Every call shares one keep-alive
+    connection pool, so repeated LLM calls skip the TCP/TLS handshake.
+    Only call this after a worker process has forked, never at import time.
+    """
     return OpenAI(
-        base_url="https://api.studio.nebius.ai/v1/",
-        api_key=api_key,
+        base_url=BASE_URL,
+        api_key=_get_api_key(),
+        http_client=DefaultHttpxClient(limits=CONNECTION_LIMITS),
+    )
+
+
+def get_async_client():
+    """
+    Returns a new AsyncOpenAI client with the same pool limits as get_client.
+    Its connections belong to the running event loop, so create one per
+    loop and share it across every coroutine gathered on that loop.
+    """
+    return AsyncOpenAI(
+        base_url=BASE_URL,
+        api_key=_get_api_key(),
+        http_client=DefaultAsyncHttpxClient(limits=CONNECTION_LIMITS),
     )
@@ -1,5 +1,17 @@
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.messages import convert_to_openai_messages
+from functools import lru_cache
+from string import Formatter
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template: str):
+    """
+    Checks an f-string style template once and returns its bound renderer,
+    so each call is a single str.format_map over the per-call params.
+    """
+    # Raises ValueError on unbalanced braces, as the template engine would.
+    for _ in Formatter().parse(template):
+        pass
+    return template.format_map
 
 
 def get_templated_messages(
@@ -11,13 +23,10 @@ def get_templated_messages(
     Returns a list of messages formatted for OpenAI API.
     """
     params = params or {}
-    prompt_template = ChatPromptTemplate.from_messages(
-        [("system", system_prompt), ("user", user_prompt)]
-    )
-    templated_messages = convert_to_openai_messages(
-        prompt_template.invoke(params).to_messages()
-    )
-    return templated_messages
+    return [
+        {"role": "system", "content": _compile_template(system_prompt)(params)},
+        {"role": "user", "content": _compile_template(user_prompt)(params)},
+    ]
 
 
 if __name__ == "__main__":
@@ -85,10 +85,32 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Keep connections open between requests and Celery tasks instead of
+        # reconnecting for each one; a stale connection is replaced on reuse.
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
 
+# Cache
+# Web and Celery processes must see the same entries, so both caches live in
+# the Redis instance that serves the broker. "default" holds short-lived task
+# locks and status payloads; "llm" holds LLM results (see ai/cache.py) in a
+# database of its own, so flushing one never drops the other.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://redis:6379/2",
+    },
+    "llm": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://redis:6379/3",
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -143,6 +165,10 @@ REST_FRAMEWORK = {
         # This ensures endpoints are protected by default
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "learning.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -222,4 +248,12 @@ import sys
 
 if "pytest" in sys.argv[0] or "py.test" in sys.argv[0]:
     CELERY_TASK_ALWAYS_EAGER = True
-    CELERY_TASK_EAGER_PROPAGATES_EXCEPTIONS = True
\ No newline at end of file
+    CELERY_TASK_EAGER_PROPAGATES_EXCEPTIONS = True
+    # Tests run in one process without Redis.
+    CACHES = {
+        alias: {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": alias,
+        }
+        for alias in ("default", "llm")
+    }
\ No newline at end of file
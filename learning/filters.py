@@ -3,18 +3,54 @@ import django_filters
 from learning.models import Phrase, LexicalUnit, LexicalUnitTranslation
 
 
-class PhraseFilter(django_filters.FilterSet):
+class CachedFormFilterSet(django_filters.FilterSet):
+    """
+    A FilterSet that builds its validation form class once per subclass
+    instead of on every request. Only suitable for filters whose form
+    fields do not depend on the request.
+    """
+
+    def get_form_class(self):
+        cls = type(self)
+        form_class = cls.__dict__.get("_cached_form_class")
+        if form_class is None:
+            form_class = super().get_form_class()
+            cls._cached_form_class = form_class
+        return form_class
+
+
+class PhraseFilter(CachedFormFilterSet):
+    # The unit lookups filter through an id subquery on the M2M table rather
+    # than joining it, so a phrase matching several units is returned once
+    # and the pagination COUNT does not run over the multiplied join.
+    units__lemma = django_filters.CharFilter(method="filter_units_lemma")
+    units__lemma__icontains = django_filters.CharFilter(
+        method="filter_units_lemma_icontains"
+    )
+
     class Meta:
         model = Phrase
         fields = {
             "cefr": ["exact"],
             "language": ["exact"],
             "category": ["exact"],
-            "units__lemma": ["exact", "icontains"],
         }
 
+    def filter_units_lemma(self, queryset, name, value):
+        return self._filter_by_units(queryset, lexicalunit__lemma=value)
+
+    def filter_units_lemma_icontains(self, queryset, name, value):
+        return self._filter_by_units(queryset, lexicalunit__lemma__icontains=value)
+
+    @staticmethod
+    def _filter_by_units(queryset, **lookups):
+        phrase_ids = Phrase.units.through.objects.filter(**lookups).values(
+            "phrase_id"
+        )
+        return queryset.filter(pk__in=phrase_ids)
+
 
-class LexicalUnitFilter(django_filters.FilterSet):
+class LexicalUnitFilter(CachedFormFilterSet):
     class Meta:
         model = LexicalUnit
         fields = {
@@ -24,7 +60,7 @@ class LexicalUnitFilter(django_filters.FilterSet):
         }
 
 
-class LexicalUnitTranslationFilter(django_filters.FilterSet):
+class LexicalUnitTranslationFilter(CachedFormFilterSet):
     class Meta:
         model = LexicalUnitTranslation
         fields = {
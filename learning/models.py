@@ -11,7 +11,11 @@ from learning.enums import (
     PhraseCategory,
 )
 from learning.utils import get_canonical_lemma
-from learning.validators import bcp47_validator, supported_language_validator
+from learning.validators import (
+    bcp47_validator,
+    canonical_language_code,
+    supported_language_validator,
+)
 
 
 class LexicalUnit(models.Model):
@@ -86,6 +90,8 @@ class LexicalUnit(models.Model):
     def save(self, *args, **kwargs):
         # Логика определения unit_type по пробелу удаляется.
         self.lemma = get_canonical_lemma(self.lemma)
+        if self.language:
+            self.language = canonical_language_code(self.language)
         super().save(*args, **kwargs)
 
     def __str__(self):
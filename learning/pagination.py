@@ -0,0 +1,12 @@
+# learning/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class LemmaCursorPagination(CursorPagination):
+    """
+    Keyset pagination over lemma, so deep pages are an index range scan
+    rather than an OFFSET scan followed by a COUNT(*).
+    """
+
+    ordering = ("lemma", "id")
+    page_size = 50
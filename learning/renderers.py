@@ -0,0 +1,25 @@
+# learning/renderers.py
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder knows how to handle lazy strings, Decimals, QuerySets, etc.
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renders API responses with orjson, which writes bytes straight from the
+    Python objects instead of building an intermediate str like json.dumps.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(
+            data, default=_drf_default, option=orjson.OPT_NON_STR_KEYS
+        )
@@ -3,15 +3,21 @@ from .base import LanguageField
 from .external import ExternalImportSerializer, ExternalTextPayloadSerializer
 from .lexical_units import (
     LexicalUnitSerializer,
+    LexicalUnitListSerializer,
     LexicalUnitTranslationSerializer,
     LexicalUnitTranslationBulkSerializer,
 )
-from .phrases import PhraseSerializer, PhraseTranslationSerializer
+from .phrases import (
+    PhraseSerializer,
+    PhraseListSerializer,
+    PhraseTranslationSerializer,
+)
 from .tasks import (
     ResolveLemmaRequestSerializer,
     ResolvedLemmaResponseSerializer,
     PhraseGenerationRequestSerializer,
     EnrichDetailsRequestSerializer,
+    BulkEnrichDetailsRequestSerializer,
     TranslateRequestSerializer,
     AnalyzeTextRequestSerializer,
 )
@@ -22,14 +28,17 @@ __all__ = [
     "ExternalImportSerializer",
     "ExternalTextPayloadSerializer",
     "LexicalUnitSerializer",
+    "LexicalUnitListSerializer",
     "LexicalUnitTranslationSerializer",
     "LexicalUnitTranslationBulkSerializer",
     "PhraseSerializer",
+    "PhraseListSerializer",
     "PhraseTranslationSerializer",
     "ResolveLemmaRequestSerializer",
     "ResolvedLemmaResponseSerializer",
     "PhraseGenerationRequestSerializer",
     "EnrichDetailsRequestSerializer",
+    "BulkEnrichDetailsRequestSerializer",
     "TranslateRequestSerializer",
     "AnalyzeTextRequestSerializer",
 ]
\ No newline at end of file
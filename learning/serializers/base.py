@@ -1,6 +1,12 @@
 # learning/serializers/base.py
+import copy
+
 from rest_framework import serializers
-from learning.validators import bcp47_validator, supported_language_validator
+from learning.validators import (
+    bcp47_validator,
+    canonical_language_code,
+    supported_language_validator,
+)
 
 
 class LanguageField(serializers.CharField):
@@ -9,4 +15,57 @@ class LanguageField(serializers.CharField):
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("max_length", 16)
         kwargs.setdefault("validators", [bcp47_validator, supported_language_validator])
-        super().__init__(*args, **kwargs)
\ No newline at end of file
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        # Normalize to the configured spelling so validated codes can be
+        # compared with stored ones directly.
+        return canonical_language_code(super().to_internal_value(data))
+
+
+class EagerLoadingMixin:
+    """
+    Lets a serializer declare the relations it renders, so viewsets can
+    eager-load them through `setup_eager_loading()` instead of hard-coding
+    select_related/prefetch_related calls.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
+
+
+class PlainDictListSerializer(serializers.ListSerializer):
+    """
+    A list serializer that always emits plain ``dict`` items.
+    Keeps the payload cheap to pickle (Django cache) and to JSON-encode.
+    """
+
+    def to_representation(self, data):
+        return [
+            item if type(item) is dict else dict(item)
+            for item in super().to_representation(data)
+        ]
+
+
+class CachedFieldsSerializer(serializers.Serializer):
+    """
+    A flat Serializer that deep-copies its declared fields once per class
+    and gives each instance cheap shallow copies of them. Not suitable
+    for serializers with nested serializer fields.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        template = cls.__dict__.get("_fields_template")
+        if template is None:
+            template = super().get_fields()
+            cls._fields_template = template
+        return {name: copy.copy(field) for name, field in template.items()}
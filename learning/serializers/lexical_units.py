@@ -1,18 +1,97 @@
 # learning/serializers/lexical_units.py
+from django.db import transaction
+from django.db.models import Q
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
-from .base import LanguageField
+from .base import EagerLoadingMixin, LanguageField, PlainDictListSerializer
 from ..enums import LexicalCategory, PartOfSpeech, TranslationType
 from ..models import LexicalUnit, LexicalUnitTranslation
+from ..task_batcher import log_queue_failure, task_batcher
+from ..tasks import validate_lu_integrity_async, verify_translation_link_async
 from ..utils import get_canonical_lemma
 
+DUPLICATE_UNIT_ERROR = "This lexical unit already exists in your list."
 
-class LexicalUnitSerializer(serializers.ModelSerializer):
+
+def _queue_for_each(task, id_kwarg, ids):
+    """
+    Queues `task` once per id through the task batcher once the surrounding
+    transaction commits, so workers never miss the new rows and create()
+    never waits on the broker. Stands in for the post_save signal handlers,
+    which bulk_create() does not trigger.
+    """
+    if not ids:
+        return
+
+    def publish():
+        for pk in ids:
+            try:
+                task_batcher.submit(task, **{id_kwarg: pk})
+            except Exception as e:
+                log_queue_failure(task.name, e)
+
+    transaction.on_commit(publish)
+
+
+class LexicalUnitBulkListSerializer(PlainDictListSerializer):
+    """
+    Checks all items for duplicates with one query and creates them with
+    one INSERT per `batch_size` rows instead of one `save()` per unit.
+    """
+
+    batch_size = 500
+    natural_key = ("lemma", "language", "part_of_speech", "lexical_category")
+
+    def to_internal_value(self, data):
+        items = super().to_internal_value(data)
+        request = self.context.get("request")
+        if not items or not (request and hasattr(request, "user")):
+            return items
+
+        keys = [tuple(item.get(f) for f in self.natural_key) for item in items]
+        lookup = Q()
+        for key in set(keys):
+            lookup |= Q(**dict(zip(self.natural_key, key)))
+        existing = set(
+            LexicalUnit.objects.filter(lookup, user=request.user).values_list(
+                *self.natural_key
+            )
+        )
+
+        errors, seen = [], set()
+        for key in keys:
+            is_duplicate = key in existing or key in seen
+            errors.append(
+                {api_settings.NON_FIELD_ERRORS_KEY: [DUPLICATE_UNIT_ERROR]}
+                if is_duplicate
+                else {}
+            )
+            seen.add(key)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
+
+    def create(self, validated_data):
+        # The serializer has already canonicalized lemma and language, which
+        # is all LexicalUnit.save() would add.
+        units = LexicalUnit.objects.bulk_create(
+            [LexicalUnit(**attrs) for attrs in validated_data],
+            batch_size=self.batch_size,
+        )
+        _queue_for_each(
+            validate_lu_integrity_async, "unit_id", [unit.id for unit in units]
+        )
+        return units
+
+
+class LexicalUnitSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(read_only=True)
     language = LanguageField()
 
     class Meta:
         model = LexicalUnit
+        list_serializer_class = LexicalUnitBulkListSerializer
         fields = [
             "id",
             "user",
@@ -41,7 +120,9 @@ class LexicalUnitSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         """Custom validation to check for uniqueness before hitting the database."""
-        if not self.instance:  # Only on create
+        # Inside a list the bulk list serializer checks every item in one query.
+        in_list = isinstance(self.parent, serializers.ListSerializer)
+        if not self.instance and not in_list:  # Only on create
             request = self.context.get("request")
             if request and hasattr(request, "user"):
                 query_params = {
@@ -52,12 +133,41 @@ class LexicalUnitSerializer(serializers.ModelSerializer):
                     "lexical_category": data.get("lexical_category"),
                 }
                 if LexicalUnit.objects.filter(**query_params).exists():
-                    raise serializers.ValidationError(
-                        "This lexical unit already exists in your list."
-                    )
+                    raise serializers.ValidationError(DUPLICATE_UNIT_ERROR)
         return data
 
 
+class LexicalUnitListSerializer(EagerLoadingMixin, serializers.BaseSerializer):
+    """
+    Read-only twin of LexicalUnitSerializer for list endpoints.
+    Builds the same payload directly from model attributes, skipping
+    per-field binding and attribute lookup.
+    """
+
+    _datetime_field = serializers.DateTimeField()
+
+    class Meta:
+        list_serializer_class = PlainDictListSerializer
+
+    def to_representation(self, instance):
+        to_datetime = self._datetime_field.to_representation
+        return {
+            "id": instance.id,
+            "user": instance.user_id,
+            "lemma": instance.lemma,
+            "lexical_category": instance.lexical_category,
+            "language": instance.language,
+            "status": instance.status,
+            "notes": instance.notes,
+            "date_added": to_datetime(instance.date_added),
+            "last_reviewed": to_datetime(instance.last_reviewed),
+            "part_of_speech": instance.part_of_speech,
+            "pronunciation": instance.pronunciation,
+            "validation_status": instance.validation_status,
+            "validation_notes": instance.validation_notes,
+        }
+
+
 class LexicalUnitInputSerializer(serializers.Serializer):
     """Validates the structure of individual lexical unit data for bulk operations."""
 
@@ -70,7 +180,7 @@ class LexicalUnitInputSerializer(serializers.Serializer):
     )
 
 
-class LexicalUnitTranslationSerializer(serializers.ModelSerializer):
+class LexicalUnitTranslationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     class Meta:
         model = LexicalUnitTranslation
         fields = [
@@ -115,6 +225,9 @@ class LexicalUnitTranslationBulkSerializer(serializers.Serializer):
     )
     confidence = serializers.FloatField(required=False, min_value=0.0, max_value=1.0)
 
+    # Natural key of a unit within one user's list (see LexicalUnit.Meta).
+    unit_key = ("lemma", "language", "lexical_category", "part_of_speech")
+
     def validate_source_unit(self, data):
         data["lemma"] = get_canonical_lemma(data["lemma"])
         return data
@@ -143,20 +256,86 @@ class LexicalUnitTranslationBulkSerializer(serializers.Serializer):
             part_of_speech=source_data["part_of_speech"],
             defaults={"pronunciation": source_data.get("pronunciation", "")},
         )
-        created_translations = []
+        target_units = self._get_or_create_targets(user, targets_data)
+        links = self._get_or_create_links(source_unit, target_units, translation_type)
+        return [links[target_unit.id] for target_unit in target_units]
+
+    def _get_or_create_targets(self, user, targets_data):
+        """
+        Resolves all target units with a constant number of queries instead
+        of one get_or_create() per target.
+        """
+        by_key = {}
         for target_data in targets_data:
-            target_unit, _ = LexicalUnit.objects.get_or_create(
-                user=user,
-                lemma=target_data["lemma"],
-                language=target_data["language"],
-                lexical_category=target_data["lexical_category"],
-                part_of_speech=target_data["part_of_speech"],
-                defaults={"pronunciation": target_data.get("pronunciation", "")},
+            key = tuple(target_data[field] for field in self.unit_key)
+            by_key.setdefault(key, target_data)
+
+        units = self._fetch_units(user, by_key)
+        missing = [key for key in by_key if key not in units]
+        if missing:
+            LexicalUnit.objects.bulk_create(
+                [
+                    LexicalUnit(
+                        user=user,
+                        pronunciation=by_key[key].get("pronunciation", ""),
+                        **dict(zip(self.unit_key, key)),
+                    )
+                    for key in missing
+                ],
+                ignore_conflicts=True,
+            )
+            new_units = self._fetch_units(user, missing)
+            _queue_for_each(
+                validate_lu_integrity_async,
+                "unit_id",
+                [unit.id for unit in new_units.values()],
+            )
+            units.update(new_units)
+
+        return [
+            units[tuple(target_data[field] for field in self.unit_key)]
+            for target_data in targets_data
+        ]
+
+    def _fetch_units(self, user, keys):
+        lookup = Q()
+        for key in keys:
+            lookup |= Q(**dict(zip(self.unit_key, key)))
+        return {
+            tuple(getattr(unit, field) for field in self.unit_key): unit
+            for unit in LexicalUnit.objects.filter(lookup, user=user)
+        }
+
+    @staticmethod
+    def _get_or_create_links(source_unit, target_units, translation_type):
+        """Returns the source's links to `target_units`, keyed by target id."""
+        target_ids = {target_unit.id for target_unit in target_units}
+        links_qs = LexicalUnitTranslation.objects.filter(source_unit=source_unit)
+        links = {
+            link.target_unit_id: link
+            for link in links_qs.filter(target_unit_id__in=target_ids)
+        }
+        missing_ids = target_ids - links.keys()
+        if missing_ids:
+            LexicalUnitTranslation.objects.bulk_create(
+                [
+                    LexicalUnitTranslation(
+                        source_unit=source_unit,
+                        target_unit_id=target_id,
+                        translation_type=translation_type,
+                    )
+                    for target_id in missing_ids
+                ],
+                ignore_conflicts=True,
             )
-            translation, _ = LexicalUnitTranslation.objects.get_or_create(
-                source_unit=source_unit,
-                target_unit=target_unit,
-                defaults={"translation_type": translation_type},
+            new_links = {
+                link.target_unit_id: link
+                for link in links_qs.filter(target_unit_id__in=missing_ids)
+            }
+            _queue_for_each(
+                verify_translation_link_async,
+                "translation_id",
+                [link.id for link in new_links.values()],
             )
-            created_translations.append(translation)
-        return created_translations
\ No newline at end of file
+            links.update(new_links)
+        return links
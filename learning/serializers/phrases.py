@@ -1,17 +1,23 @@
 # learning/serializers/phrases.py
+from django.db.models import Prefetch
 from rest_framework import serializers
 
-from .base import LanguageField
-from ..models import Phrase, PhraseTranslation
+from .base import EagerLoadingMixin, LanguageField, PlainDictListSerializer
+from ..models import LexicalUnit, Phrase, PhraseTranslation
 
+# Phrase serializers only render unit ids, so don't load whole LexicalUnit rows.
+UNIT_IDS_PREFETCH = Prefetch("units", queryset=LexicalUnit.objects.only("id"))
 
-class PhraseSerializer(serializers.ModelSerializer):
+
+class PhraseSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    prefetch_related_fields = (UNIT_IDS_PREFETCH,)
     language = LanguageField()
     validation_status = serializers.CharField(read_only=True)
     validation_notes = serializers.CharField(read_only=True)
 
     class Meta:
         model = Phrase
+        list_serializer_class = PlainDictListSerializer
         fields = [
             "id",
             "text",
@@ -24,7 +30,28 @@ class PhraseSerializer(serializers.ModelSerializer):
         ]
 
 
-class PhraseTranslationSerializer(serializers.ModelSerializer):
+class PhraseListSerializer(EagerLoadingMixin, serializers.BaseSerializer):
+    """Read-only twin of PhraseSerializer for list endpoints."""
+
+    prefetch_related_fields = (UNIT_IDS_PREFETCH,)
+
+    class Meta:
+        list_serializer_class = PlainDictListSerializer
+
+    def to_representation(self, instance):
+        return {
+            "id": instance.id,
+            "text": instance.text,
+            "language": instance.language,
+            "category": instance.category,
+            "units": [unit.pk for unit in instance.units.all()],
+            "cefr": instance.cefr,
+            "validation_status": instance.validation_status,
+            "validation_notes": instance.validation_notes,
+        }
+
+
+class PhraseTranslationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     class Meta:
         model = PhraseTranslation
         fields = ["id", "source_phrase", "target_phrase"]
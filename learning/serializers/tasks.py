@@ -1,11 +1,12 @@
 # learning/serializers/tasks.py
 from rest_framework import serializers
 
-from .base import LanguageField
+from .base import CachedFieldsSerializer, LanguageField
 from ..enums import CEFR, PartOfSpeech
+from ..validators import canonical_language_code
 
 
-class ResolveLemmaRequestSerializer(serializers.Serializer):
+class ResolveLemmaRequestSerializer(CachedFieldsSerializer):
     """Validates the input for the lemma resolution/creation endpoint."""
 
     lemma = serializers.CharField(max_length=100)
@@ -33,26 +34,66 @@ class ResolvedLemmaResponseSerializer(serializers.Serializer):
     exists = serializers.BooleanField()
 
 
-class PhraseGenerationRequestSerializer(serializers.Serializer):
+class PhraseGenerationRequestSerializer(CachedFieldsSerializer):
+    """
+    Validates the request for the phrase generation endpoint.
+    Expects a `get_unit` callable in the context; it only runs once the
+    fields are valid, so malformed requests never hit the database.
+    """
+
     target_language = LanguageField()
     cefr = serializers.ChoiceField(choices=CEFR.choices)
 
+    def validate(self, data):
+        unit = self.context["get_unit"]()
+        # Rows saved before codes were canonicalized may hold another spelling.
+        if data["target_language"] == canonical_language_code(unit.language):
+            raise serializers.ValidationError(
+                "Target language cannot be the same as the source language."
+            )
+        data["unit"] = unit
+        return data
+
 
-class EnrichDetailsRequestSerializer(serializers.Serializer):
+class EnrichDetailsRequestSerializer(CachedFieldsSerializer):
     """Validates the request for the detail enrichment endpoint."""
 
     force_update = serializers.BooleanField(default=False, required=False)
 
 
-class TranslateRequestSerializer(serializers.Serializer):
-    """Validates the request for the translation endpoint."""
+class BulkEnrichDetailsRequestSerializer(CachedFieldsSerializer):
+    """Validates the request for the bulk detail enrichment endpoint."""
+
+    unit_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), min_length=1, max_length=500
+    )
+    force_update = serializers.BooleanField(default=False, required=False)
+
+
+class TranslateRequestSerializer(CachedFieldsSerializer):
+    """
+    Validates the request for the translation endpoint.
+    Accepts either a single `target_language_code` or a list of
+    `target_language_codes`, but not both.
+    """
+
+    target_language_code = LanguageField(required=False)
+    target_language_codes = serializers.ListField(
+        child=LanguageField(), required=False, min_length=1, max_length=20
+    )
 
-    target_language_code = LanguageField()
+    def validate(self, data):
+        if ("target_language_code" in data) == ("target_language_codes" in data):
+            raise serializers.ValidationError(
+                "Provide exactly one of 'target_language_code' or "
+                "'target_language_codes'."
+            )
+        return data
 
 
-class AnalyzeTextRequestSerializer(serializers.Serializer):
+class AnalyzeTextRequestSerializer(CachedFieldsSerializer):
     """
     Serializes the request data for analyzing a text block.
     """
 
-    text = serializers.CharField()
\ No newline at end of file
+    text = serializers.CharField()
@@ -0,0 +1,198 @@
+# learning/task_batcher.py
+import atexit
+import itertools
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from celery.utils import uuid
+
+logger = logging.getLogger(__name__)
+
+
+# Only every Nth failure carries a traceback, so a broker outage does not
+# turn traceback formatting into the bottleneck.
+QUEUE_FAILURE_TRACEBACK_EVERY = 100
+_queue_failure_counter = itertools.count()
+
+# Queued after the last task on shutdown; the worker stops when it gets it.
+_STOP = object()
+
+
+def log_queue_failure(task_name, exc):
+    failure_count = next(_queue_failure_counter)
+    logger.error(
+        "Failed to queue task %s: %s",
+        task_name,
+        exc,
+        exc_info=failure_count % QUEUE_FAILURE_TRACEBACK_EVERY == 0,
+    )
+
+
+class TaskBatcher:
+    """
+    Coalesces Celery task submissions from the request path and publishes
+    them from a background thread over a single broker connection.
+
+    `submit()` returns a pre-generated task id immediately, so views can
+    answer with 202 without waiting for the broker round-trip. If the publish
+    later fails, the id is marked FAILURE in the result backend, so clients
+    polling it see the error, and the submitter's `on_failure` is called.
+    `shutdown()` runs at interpreter exit and publishes whatever is still
+    queued, so a process going down does not drop accepted tasks.
+    """
+
+    def __init__(
+        self,
+        flush_interval=0.01,
+        max_batch_size=100,
+        max_queue_size=1000,
+        overflow_workers=4,
+    ):
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.overflow_workers = overflow_workers
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._overflow_executor = None
+        self._lock = threading.Lock()
+        self._worker = None
+        self._worker_pid = None
+
+    def submit(self, task_func, task_id=None, on_failure=None, **kwargs) -> str:
+        task_id = task_id or uuid()
+        if task_func.app.conf.task_always_eager:
+            # Eager mode (tests, local debugging) must keep synchronous semantics.
+            task_func.apply_async(kwargs=kwargs, task_id=task_id)
+            return task_id
+
+        self._ensure_worker()
+        item = (task_func, kwargs, task_id, on_failure)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Overflow: publish from the thread pool rather than dropping the task
+            # or blocking the request thread on the broker round-trip.
+            logger.warning(
+                "Task batcher queue is full; publishing %s from the overflow pool.",
+                task_func.name,
+            )
+            self._overflow_executor.submit(self._publish, item, None)
+        return task_id
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._worker_is_running(pid):
+            return
+        with self._lock:
+            if self._worker_is_running(pid):
+                return
+            # A forked child inherits the queue and the pool objects but
+            # none of their threads.
+            if self._worker_pid != pid:
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self._overflow_executor = ThreadPoolExecutor(
+                    max_workers=self.overflow_workers,
+                    thread_name_prefix="celery-task-overflow",
+                )
+            self._worker = threading.Thread(
+                target=self._run, name="celery-task-batcher", daemon=True
+            )
+            self._worker_pid = pid
+            self._worker.start()
+
+    def _worker_is_running(self, pid):
+        return (
+            self._worker is not None
+            and self._worker_pid == pid
+            and self._worker.is_alive()
+        )
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stopping = False
+            try:
+                while len(batch) < self.max_batch_size:
+                    item = self._queue.get(timeout=self.flush_interval)
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+            except queue.Empty:
+                pass
+            self._flush(batch)
+            if stopping:
+                return
+
+    def shutdown(self, timeout=5.0):
+        """
+        Publishes what is still queued before the process exits. The worker
+        gets `timeout` seconds to finish its batch; anything it has not taken
+        by then is published here, and what cannot be published is failed
+        like any other publish error.
+        """
+        # A forked child that never submitted holds a copy of the parent's
+        # queue; publishing it would send the parent's tasks twice.
+        if self._worker_pid != os.getpid():
+            return
+        try:
+            self._queue.put_nowait(_STOP)
+        except queue.Full:
+            pass
+        else:
+            self._worker.join(timeout)
+        leftover = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftover.append(item)
+        if leftover:
+            self._flush(leftover)
+        self._overflow_executor.shutdown(wait=True)
+
+    def _flush(self, batch):
+        app = batch[0][0].app
+        attempted = 0
+        try:
+            with app.producer_or_acquire() as producer:
+                for item in batch:
+                    self._publish(item, producer)
+                    attempted += 1
+        except Exception as e:
+            # Broker unavailable: fail what was not yet sent and keep the
+            # worker thread alive for the next batch.
+            for item in batch[attempted:]:
+                self._fail(item, e)
+
+    def _publish(self, item, producer):
+        task_func, kwargs, task_id, _ = item
+        try:
+            task_func.apply_async(kwargs=kwargs, task_id=task_id, producer=producer)
+        except Exception as e:
+            self._fail(item, e)
+
+    @staticmethod
+    def _fail(item, exc):
+        task_func, _, task_id, on_failure = item
+        log_queue_failure(task_func.name, exc)
+        try:
+            task_func.backend.mark_as_failure(task_id, exc)
+        except Exception as e:
+            logger.error("Failed to record publish failure of %s: %s", task_id, e)
+        if on_failure is not None:
+            try:
+                on_failure(exc)
+            except Exception as e:
+                logger.error("on_failure hook for %s failed: %s", task_id, e)
+
+
+task_batcher = TaskBatcher()
+atexit.register(task_batcher.shutdown)
@@ -1,7 +1,11 @@
 # learning/tasks.py
 import logging
-from celery import shared_task
+from typing import Optional
+
+from celery import shared_task, states
+from celery.signals import task_postrun
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 
 from learning.enums import TranslationType, PartOfSpeech, ValidationStatus
@@ -17,20 +21,68 @@ from services.verify_translation import get_translation_verification
 
 logger = logging.getLogger(__name__)
 
+# A queued enrichment holds this lock until it finishes, so concurrent
+# requests for the same unit join it instead of paying for the same LLM calls
+# twice. The lock value is the id of the task holding it.
+ENRICH_LOCK_TIMEOUT = 300
+
+
+def enrich_lock_key(unit_id: int) -> str:
+    return f"enrich:lu:{unit_id}"
+
+
+def claim_enrich_lock(
+    unit_id: int, task_id: str, force_update: bool = False
+) -> Optional[str]:
+    """
+    Takes the unit's enrich lock for `task_id`. Returns None once it is held,
+    or the id of the task already enriching the unit. A forced run never
+    waits behind another, so it takes the lock over; later requests join it.
+    """
+    lock_key = enrich_lock_key(unit_id)
+    if force_update:
+        cache.set(lock_key, task_id, ENRICH_LOCK_TIMEOUT)
+        return None
+    # cache.add() is an atomic test-and-set; the loop covers a holder that
+    # frees the lock between the add and the get.
+    while not cache.add(lock_key, task_id, ENRICH_LOCK_TIMEOUT):
+        running_task_id = cache.get(lock_key)
+        if running_task_id is not None:
+            return running_task_id
+    return None
+
+
+def release_enrich_lock(unit_id: int, task_id: str) -> None:
+    """
+    Frees the unit's enrich lock, unless another task has taken it over.
+
+    The get and the delete are two round trips, so a forced run taking the
+    lock over between them loses it. That race is accepted: the window is
+    one round trip wide, and its only cost is that a later request starts a
+    second enrichment instead of joining the forced one. Enrichment is
+    idempotent (variants are saved with get_or_create), and its LLM answer
+    is usually cached by then. An atomic compare-and-delete would need a
+    Redis script that reaches past the Django cache API to match pickled
+    values, and it would not work with the other cache backends.
+    """
+    lock_key = enrich_lock_key(unit_id)
+    if cache.get(lock_key) == task_id:
+        cache.delete(lock_key)
+
 
 @shared_task
 def generate_phrases_async(unit_id: int, target_language: str, cefr_level: str):
     try:
         unit = LexicalUnit.objects.get(id=unit_id)
     except ObjectDoesNotExist:
-        logger.error(f"❌ LexicalUnit with id={unit_id} not found.")
+        logger.error("❌ LexicalUnit with id=%s not found.", unit_id)
         return
 
     source_language = unit.language
 
     if target_language.lower() == source_language.lower():
         logger.error(
-            f"❌ Source and target languages are the same ('{source_language}')."
+            "❌ Source and target languages are the same ('%s').", source_language
         )
         return
 
@@ -51,24 +103,26 @@ def generate_phrases_async(unit_id: int, target_language: str, cefr_level: str):
         )
     except Exception as e:
         logger.error(
-            f"❌ Phrase generation pipeline failed for unit id={unit_id}: {e}",
+            "❌ Phrase generation pipeline failed for unit id=%s: %s",
+            unit_id,
+            e,
             exc_info=True,
         )
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def enrich_details_async(self, unit_id: int, user_id: int, force_update: bool = False):
-    logger.info(f"Starting enrichment process for LU ID: {unit_id}")
+    logger.info("Starting enrichment process for LU ID: %s", unit_id)
     try:
         user = User.objects.get(pk=user_id)
         initial_lu = LexicalUnit.objects.get(id=unit_id, user=user)
     except ObjectDoesNotExist:
-        logger.error(f"Cannot enrich: LU with id={unit_id} not found.")
+        logger.error("Cannot enrich: LU with id=%s not found.", unit_id)
         return
 
     try:
         client = get_client()
-        all_variants = get_lemma_details(client, initial_lu)
+        all_variants = get_lemma_details(client, initial_lu, force_update=force_update)
 
         if not all_variants:
             initial_lu.validation_status = ValidationStatus.FAILED
@@ -76,7 +130,7 @@ def enrich_details_async(self, unit_id: int, user_id: int, force_update: bool =
                 "LLM could not find any valid forms for this lemma."
             )
             initial_lu.save(update_fields=["validation_status", "validation_notes"])
-            logger.warning(f"Enrichment stopped: Initial LU {unit_id} is not valid.")
+            logger.warning("Enrichment stopped: Initial LU %s is not valid.", unit_id)
             return
 
         is_initial_lu_valid = any(
@@ -91,7 +145,7 @@ def enrich_details_async(self, unit_id: int, user_id: int, force_update: bool =
             initial_lu.validation_notes = f"Saved POS '{initial_lu.part_of_speech}' is not a likely variant. LLM suggested: [{suggested_pos}]."
             initial_lu.save(update_fields=["validation_status", "validation_notes"])
             logger.warning(
-                f"Enrichment stopped: Initial LU {unit_id} has a mismatched POS."
+                "Enrichment stopped: Initial LU %s has a mismatched POS.", unit_id
             )
             return
         else:
@@ -101,7 +155,8 @@ def enrich_details_async(self, unit_id: int, user_id: int, force_update: bool =
                 initial_lu.save(update_fields=["validation_status", "validation_notes"])
 
         logger.info(
-            f"Initial LU {unit_id} is valid. Proceeding to enrich with other POS variants."
+            "Initial LU %s is valid. Proceeding to enrich with other POS variants.",
+            unit_id,
         )
         for detail in all_variants:
             if detail.get("part_of_speech") == initial_lu.part_of_speech:
@@ -116,27 +171,39 @@ def enrich_details_async(self, unit_id: int, user_id: int, force_update: bool =
             )
             if created:
                 logger.info(
-                    f"Created new specific variant during enrichment: {specific_variant}"
+                    "Created new specific variant during enrichment: %s",
+                    specific_variant,
                 )
 
     except Exception as e:
         logger.error(
-            f"An error occurred during enrichment for LU {unit_id}: {e}", exc_info=True
+            "An error occurred during enrichment for LU %s: %s",
+            unit_id,
+            e,
+            exc_info=True,
         )
         self.retry(exc=e)
     return f"Enrichment process completed for original unit {unit_id}."
 
 
+@task_postrun.connect(sender=enrich_details_async)
+def release_enrich_lock_after_run(task_id, task, args, kwargs, state, **extra):
+    # A pending retry still owns the unit; any other outcome frees it.
+    if state != states.RETRY:
+        unit_id = kwargs.get("unit_id", args[0] if args else None)
+        release_enrich_lock(unit_id, task_id)
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def translate_unit_async(self, unit_id: int, user_id: int, target_language_code: str):
     logger.info(
-        f"Starting translation for LU ID {unit_id} to '{target_language_code}'..."
+        "Starting translation for LU ID %s to '%s'...", unit_id, target_language_code
     )
     try:
         user = User.objects.get(pk=user_id)
         source_lu = LexicalUnit.objects.get(id=unit_id, user=user)
     except ObjectDoesNotExist:
-        logger.error(f"❌ Source LU with id={unit_id} for user={user_id} not found.")
+        logger.error("❌ Source LU with id=%s for user=%s not found.", unit_id, user_id)
         return
 
     try:
@@ -147,7 +214,8 @@ def translate_unit_async(self, unit_id: int, user_id: int, target_language_code:
 
         if translation_response is None:
             logger.error(
-                f"Did not receive a valid translation object for '{source_lu.lemma}'. Aborting task."
+                "Did not receive a valid translation object for '%s'. Aborting task.",
+                source_lu.lemma,
             )
             return
 
@@ -156,7 +224,7 @@ def translate_unit_async(self, unit_id: int, user_id: int, target_language_code:
 
         if not translated_base_lemma or not details_for_translation:
             logger.warning(
-                f"Insufficient data from LLM for translation of '{source_lu.lemma}'"
+                "Insufficient data from LLM for translation of '%s'", source_lu.lemma
             )
             return
 
@@ -165,7 +233,7 @@ def translate_unit_async(self, unit_id: int, user_id: int, target_language_code:
             trans_pron = trans_detail.pronunciation
 
             if not (trans_pos and trans_pos in PartOfSpeech.values):
-                logger.warning(f"Skipping variant due to invalid POS '{trans_pos}'")
+                logger.warning("Skipping variant due to invalid POS '%s'", trans_pos)
                 continue
 
             final_translated_lu, _ = LexicalUnit.objects.get_or_create(
@@ -180,9 +248,9 @@ def translate_unit_async(self, unit_id: int, user_id: int, target_language_code:
                 target_unit=final_translated_lu,
                 defaults={"translation_type": TranslationType.AI},
             )
-            logger.info(f"Successfully linked {source_lu} -> {final_translated_lu}")
+            logger.info("Successfully linked %s -> %s", source_lu, final_translated_lu)
     except Exception as e_trans:
-        logger.error(f"❌ Error in translation pipeline for {source_lu}: {e_trans}")
+        logger.error("❌ Error in translation pipeline for %s: %s", source_lu, e_trans)
         self.retry(exc=e_trans)
 
 
@@ -206,20 +274,20 @@ def resolve_lemma_async(self, lemma: str, language: str, user_id: int):
             processed_variants.append(variant)
         return processed_variants
     except Exception as e:
-        logger.error(f"Error in resolve_lemma_async for lemma '{lemma}': {e}")
+        logger.error("Error in resolve_lemma_async for lemma '%s': %s", lemma, e)
         raise
 
 
 @shared_task(bind=True)
 def verify_translation_link_async(self, translation_id: int):
-    logger.info(f"Starting translation link verification for ID: {translation_id}")
+    logger.info("Starting translation link verification for ID: %s", translation_id)
     try:
         translation = LexicalUnitTranslation.objects.select_related(
             "source_unit", "target_unit"
         ).get(id=translation_id)
     except ObjectDoesNotExist:
         logger.error(
-            f"Cannot verify: Translation link with id={translation_id} not found."
+            "Cannot verify: Translation link with id=%s not found.", translation_id
         )
         return
     try:
@@ -241,7 +309,9 @@ def verify_translation_link_async(self, translation_id: int):
         translation.validation_notes = justification
     except Exception as e:
         logger.error(
-            f"Error during translation link verification for ID {translation.id}: {e}",
+            "Error during translation link verification for ID %s: %s",
+            translation.id,
+            e,
             exc_info=True,
         )
         translation.validation_status = ValidationStatus.FAILED
@@ -252,17 +322,20 @@ def verify_translation_link_async(self, translation_id: int):
             update_fields=["validation_status", "validation_notes", "confidence"]
         )
         logger.info(
-            f"Verification for link {translation.id} finished with status '{translation.validation_status}' and confidence {translation.confidence}."
+            "Verification for link %s finished with status '%s' and confidence %s.",
+            translation.id,
+            translation.validation_status,
+            translation.confidence,
         )
 
 
 @shared_task(bind=True, max_retries=2)
 def validate_lu_integrity_async(self, unit_id: int):
-    logger.info(f"Starting integrity validation for LU ID: {unit_id}")
+    logger.info("Starting integrity validation for LU ID: %s", unit_id)
     try:
         unit = LexicalUnit.objects.get(id=unit_id)
     except ObjectDoesNotExist:
-        logger.error(f"Cannot validate: LexicalUnit with id={unit_id} not found.")
+        logger.error("Cannot validate: LexicalUnit with id=%s not found.", unit_id)
         return
     try:
         client = get_client()
@@ -273,7 +346,9 @@ def validate_lu_integrity_async(self, unit_id: int):
                 "LLM did not return any valid variants for this lemma."
             )
             unit.save(update_fields=["validation_status", "validation_notes"])
-            logger.warning(f"Validation failed for LU {unit.id}: No variants from LLM.")
+            logger.warning(
+                "Validation failed for LU %s: No variants from LLM.", unit.id
+            )
             return
         found_match = False
         for variant in llm_variants:
@@ -289,11 +364,11 @@ def validate_lu_integrity_async(self, unit_id: int):
             )
             unit.validation_notes = f"Saved POS is '{unit.part_of_speech}', but LLM suggested: [{suggested_pos}]."
             logger.warning(
-                f"Validation mismatch for LU {unit.id}: {unit.validation_notes}"
+                "Validation mismatch for LU %s: %s", unit.id, unit.validation_notes
             )
         unit.save(update_fields=["validation_status", "validation_notes"])
     except Exception as e:
-        logger.error(f"Error during validation for LU {unit.id}: {e}")
+        logger.error("Error during validation for LU %s: %s", unit.id, e)
         self.retry(exc=e)
 
 
@@ -303,11 +378,11 @@ def enrich_phrase_async(self, phrase_id: int):
     Asynchronously enriches a Phrase object by verifying it and filling in
     missing details using an LLM. Now with robust error handling.
     """
-    logger.info(f"Starting enrichment task for Phrase ID: {phrase_id}")
+    logger.info("Starting enrichment task for Phrase ID: %s", phrase_id)
     try:
         phrase = Phrase.objects.get(id=phrase_id)
     except ObjectDoesNotExist:
-        logger.error(f"Cannot enrich: Phrase with id={phrase_id} not found.")
+        logger.error("Cannot enrich: Phrase with id=%s not found.", phrase_id)
         return
 
     try:
@@ -322,7 +397,8 @@ def enrich_phrase_async(self, phrase_id: int):
             phrase.validation_notes = "Enrichment failed: the analysis service did not return a valid response from the LLM."
             phrase.save()
             logger.warning(
-                f"Enrichment for Phrase {phrase_id} marked as FAILED due to service error."
+                "Enrichment for Phrase %s marked as FAILED due to service error.",
+                phrase_id,
             )
             return
 
@@ -370,14 +446,18 @@ def enrich_phrase_async(self, phrase_id: int):
         phrase.validation_notes = " | ".join(notes)
         phrase.save()
         logger.info(
-            f"Enrichment for Phrase {phrase_id} finished with status '{phrase.validation_status}'."
+            "Enrichment for Phrase %s finished with status '%s'.",
+            phrase_id,
+            phrase.validation_status,
         )
         # --- END OF REFACTORED LOGIC ---
 
     except Exception as e:
         # This block will now only catch truly unexpected errors.
         logger.error(
-            f"An unexpected error occurred during phrase enrichment for ID {phrase_id}: {e}",
+            "An unexpected error occurred during phrase enrichment for ID %s: %s",
+            phrase_id,
+            e,
             exc_info=True,
         )
         phrase.validation_status = ValidationStatus.FAILED
@@ -399,8 +479,7 @@ def analyze_text_and_suggest_words_async(self, text: str, user_id: int):
     Returns:
         A list of suggested lemmas (strings) or an error message.
     """
-    logger.info(f"Starting text analysis for user {user_id}.")
-    suggested_lemmas = []
+    logger.info("Starting text analysis for user %s.", user_id)
     try:
         user = User.objects.get(pk=user_id)
         client = get_client()
@@ -412,7 +491,7 @@ def analyze_text_and_suggest_words_async(self, text: str, user_id: int):
 
         if not extracted_lemmas:
             logger.warning(
-                f"No lemmas found or text analysis failed for user {user_id}."
+                "No lemmas found or text analysis failed for user %s.", user_id
             )
             return {
                 "status": "failed",
@@ -429,21 +508,24 @@ def analyze_text_and_suggest_words_async(self, text: str, user_id: int):
         user_known_lemmas_lower = {lemma.lower() for lemma in user_known_lemmas}
 
         # Step 3: Filter out known lemmas.
-        for lemma in extracted_lemmas:
-            lemma_lower = lemma.lower()
-            if lemma_lower not in user_known_lemmas_lower:
-                suggested_lemmas.append(lemma)
+        suggested_lemmas = {
+            lemma
+            for lemma in extracted_lemmas
+            if lemma.lower() not in user_known_lemmas_lower
+        }
 
         return {
             "status": "success",
-            "suggested_words": sorted(list(set(suggested_lemmas))),
+            "suggested_words": sorted(suggested_lemmas),
         }
     except ObjectDoesNotExist:
-        logger.error(f"User with id={user_id} not found.")
+        logger.error("User with id=%s not found.", user_id)
         self.retry(exc=ObjectDoesNotExist())
     except Exception as e:
         logger.error(
-            f"Error in analyze_text_and_suggest_words_async for user {user_id}: {e}",
+            "Error in analyze_text_and_suggest_words_async for user %s: %s",
+            user_id,
+            e,
             exc_info=True,
         )
         self.retry(exc=e)
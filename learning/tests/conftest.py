@@ -2,6 +2,7 @@
 import os
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import caches
 from rest_framework.test import APIClient
 from unittest.mock import patch
 
@@ -23,6 +24,16 @@ def set_env_for_tests():
     os.environ["NEBIUS_API_KEY"] = "dummy-test-api-key"
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keeps cached LLM results and task locks from leaking between tests."""
+    for cache in caches.all():
+        cache.clear()
+    yield
+    for cache in caches.all():
+        cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def mock_llm_services():
     """Globally mocks all high-level services that interact with the LLM."""
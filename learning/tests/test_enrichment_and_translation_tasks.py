@@ -1,9 +1,11 @@
 # In learning/tests/test_enrichment_and_translation_tasks.py
+import json
 import pytest
 from unittest.mock import patch
 from learning.models import LexicalUnit, LexicalUnitTranslation
 from learning.enums import PartOfSpeech, ValidationStatus, LexicalCategory
 from learning.tasks import enrich_details_async, translate_unit_async
+from services.get_lemma_details import get_lemma_details, get_lemma_details_batch
 from services.translate_lemma import TranslationResponse, TranslationDetail
 
 pytestmark = pytest.mark.django_db
@@ -127,3 +129,65 @@ def test_enrich_stops_if_initial_lu_is_not_found_by_llm(
     assert lu_to_test.validation_status == ValidationStatus.FAILED
     assert "LLM could not find any valid forms" in lu_to_test.validation_notes
     assert LexicalUnit.objects.filter(lemma="asdfqwerty").count() == 1
+
+
+@patch("services.get_lemma_details.answer_with_llm")
+def test_lemma_details_batch_sends_one_request_per_language(
+    mock_answer_with_llm, lexical_unit_factory
+):
+    units = [
+        lexical_unit_factory(lemma="cat", language="en"),
+        lexical_unit_factory(lemma="Katze", language="de"),
+        lexical_unit_factory(lemma="dog", language="en"),
+    ]
+
+    def fake_llm(messages, **kwargs):
+        lemmas = json.loads(messages[1]["content"].split("\n")[0].split(": ", 1)[1])
+        return json.dumps(
+            {
+                "results": [
+                    {
+                        "lemma": lemma,
+                        "lemma_details": [
+                            {
+                                "lexical_category": "SINGLE_WORD",
+                                "part_of_speech": "noun",
+                            }
+                        ],
+                    }
+                    for lemma in lemmas
+                    if lemma != "dog"
+                ]
+            }
+        )
+
+    mock_answer_with_llm.side_effect = fake_llm
+
+    results = get_lemma_details_batch(client=None, lexical_units=units)
+
+    assert mock_answer_with_llm.call_count == 2
+    assert [len(details) for details in results] == [1, 1, 0]
+    assert results[1][0]["part_of_speech"] == PartOfSpeech.NOUN
+
+
+@patch("services.get_lemma_details.answer_with_llm")
+def test_forced_lemma_details_skip_the_cached_answer(
+    mock_answer_with_llm, lexical_unit_factory
+):
+    unit = lexical_unit_factory(lemma="cat", language="en")
+    mock_answer_with_llm.return_value = json.dumps(
+        {
+            "lemma_details": [
+                {"lexical_category": "SINGLE_WORD", "part_of_speech": "noun"}
+            ]
+        }
+    )
+
+    get_lemma_details(None, unit)
+    get_lemma_details(None, unit)
+    assert mock_answer_with_llm.call_count == 1
+
+    details = get_lemma_details(None, unit, force_update=True)
+
+    assert mock_answer_with_llm.call_count == 2
+    assert details[0]["part_of_speech"] == PartOfSpeech.NOUN
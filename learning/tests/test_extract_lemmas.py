@@ -0,0 +1,72 @@
+import spacy
+from unittest.mock import patch
+
+from services.extract_lemmas import (
+    LLMLemmaExtractor,
+    SpaCyLemmaExtractor,
+    extract_lemmas_from_text,
+)
+
+
+@spacy.Language.component("test_lower_lemmatizer")
+def _lower_lemmatizer(doc):
+    for token in doc:
+        token.lemma_ = token.lower_
+    return doc
+
+
+def _blank_english():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("test_lower_lemmatizer")
+    return nlp
+
+
+@patch("services.extract_lemmas._get_spacy_pipeline")
+def test_extract_many_runs_one_pipe_pass(mock_get_pipeline):
+    nlp = _blank_english()
+    mock_get_pipeline.return_value = nlp
+
+    with patch.object(nlp, "pipe", wraps=nlp.pipe) as mock_pipe:
+        results = SpaCyLemmaExtractor().extract_many(
+            ["The Cats sleep.", "Dogs bark at 3 cats"], "en-GB"
+        )
+
+    mock_pipe.assert_called_once()
+    mock_get_pipeline.assert_called_once_with("en")
+    assert results == [["cats", "sleep"], ["bark", "cats", "dogs"]]
+
+
+@patch("services.extract_lemmas._get_spacy_pipeline")
+def test_extract_lemmas_from_text_accepts_a_list(mock_get_pipeline):
+    mock_get_pipeline.return_value = _blank_english()
+
+    assert extract_lemmas_from_text(None, ["Quiet river"], "en") == [["quiet", "river"]]
+    assert extract_lemmas_from_text(None, "Quiet river", "en") == ["quiet", "river"]
+
+
+@patch("services.extract_lemmas._get_spacy_pipeline")
+def test_extract_handles_texts_without_lemmas(mock_get_pipeline):
+    mock_get_pipeline.return_value = _blank_english()
+
+    assert SpaCyLemmaExtractor().extract_many(["", "a 42 !", "I"], "en") == [
+        [],
+        [],
+        [],
+    ]
+
+
+@patch("services.extract_lemmas.answer_with_llm")
+def test_llm_lemmas_keep_their_case(mock_answer_with_llm):
+    # German nouns are capitalized; lower-casing would corrupt them.
+    mock_answer_with_llm.return_value = '{"lemmas": ["Haus", "laufen"]}'
+
+    assert LLMLemmaExtractor(client=None).extract("text") == ["Haus", "laufen"]
+
+
+def test_extract_many_uses_worker_processes_only_for_large_batches(monkeypatch):
+    monkeypatch.setattr("services.extract_lemmas.os.cpu_count", lambda: 8)
+    extractor = SpaCyLemmaExtractor()
+
+    assert extractor._n_process(10) == 1
+    assert extractor._n_process(128) == 4
+    assert extractor._n_process(10_000) == 8
@@ -1,7 +1,13 @@
 import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from learning.models import LexicalUnit
+from learning.models import LexicalUnit, LexicalUnitTranslation
 from learning.enums import PartOfSpeech
+from learning.serializers import LexicalUnitSerializer
+from learning.tasks import enrich_lock_key
 
 # All tests in this file will be run against the database
 pytestmark = pytest.mark.django_db
@@ -62,6 +68,91 @@ class TestLexicalUnitAPI:
         assert response2.status_code == 201
         assert LexicalUnit.objects.filter(lemma="shared_lemma").count() == 2
 
+    def test_create_lexical_units_in_bulk(self, authenticated_client):
+        url = reverse("lexicalunit-list")
+        payload = [
+            {"lemma": "apple", "language": "en", "part_of_speech": PartOfSpeech.NOUN},
+            {"lemma": "run", "language": "en", "part_of_speech": PartOfSpeech.VERB},
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 201
+        assert [item["lemma"] for item in response.data] == ["apple", "run"]
+        assert all(item["id"] for item in response.data)
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+
+    def test_bulk_create_endpoint_inserts_in_one_statement(self, authenticated_client):
+        url = reverse("lexicalunit-bulk-create")
+        payload = [
+            {
+                "lemma": f"word {i}",
+                "language": "en",
+                "part_of_speech": PartOfSpeech.NOUN,
+            }
+            for i in range(20)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 201
+        assert all(item["id"] for item in response.data)
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+        assert LexicalUnit.objects.filter(lemma__startswith="word ").count() == 20
+
+    def test_bulk_create_queues_validation_after_commit(
+        self, authenticated_client, django_capture_on_commit_callbacks
+    ):
+        url = reverse("lexicalunit-bulk-create")
+        payload = [
+            {"lemma": lemma, "language": "en", "part_of_speech": "noun"}
+            for lemma in ("apple", "pear")
+        ]
+        with patch("learning.serializers.lexical_units.task_batcher") as batcher:
+            with django_capture_on_commit_callbacks(execute=True) as callbacks:
+                response = authenticated_client.post(url, payload, format="json")
+                assert batcher.submit.call_count == 0
+            assert len(callbacks) == 1
+        queued = [c.kwargs["unit_id"] for c in batcher.submit.call_args_list]
+        assert queued == [item["id"] for item in response.data]
+
+    def test_bulk_create_checks_duplicates_in_one_query(self, authenticated_client):
+        url = reverse("lexicalunit-bulk-create")
+        payload = [
+            {"lemma": f"word {i}", "language": "en", "part_of_speech": "noun"}
+            for i in range(20)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            authenticated_client.post(url, payload, format="json")
+        # One duplicate check for the whole list, then the INSERT.
+        statements = [q["sql"].split(" ", 1)[0] for q in ctx.captured_queries]
+        assert statements[:2] == ["SELECT", "INSERT"]
+
+    def test_bulk_create_reports_duplicates_per_item(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        lexical_unit_factory(lemma="apple", language="en", part_of_speech="noun")
+        url = reverse("lexicalunit-bulk-create")
+        payload = [
+            {"lemma": "apple", "language": "en", "part_of_speech": "noun"},
+            {"lemma": "pear", "language": "en", "part_of_speech": "noun"},
+            {"lemma": "pear", "language": "en", "part_of_speech": "noun"},
+        ]
+        response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 400
+        assert [bool(item) for item in response.data] == [True, False, True]
+        assert not LexicalUnit.objects.filter(lemma="pear").exists()
+
+    def test_create_single_invalid_lexical_unit_returns_field_errors(
+        self, authenticated_client
+    ):
+        url = reverse("lexicalunit-list")
+        payload = {"lemma": "apple", "language": "xx-invalid-code"}
+        response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 400
+        # A single object keeps the non-bulk error shape (a dict keyed by field).
+        assert "language" in response.data
+
     def test_get_lexical_unit_list_returns_only_own_units(
         self, authenticated_client, lexical_unit_factory, user_factory, default_user
     ):
@@ -90,6 +181,63 @@ class TestLexicalUnitAPI:
             response.data["results"][0]["lemma"] == "my_apple"
         )  # Adjusted for pagination
 
+    def test_lexical_unit_list_matches_full_serializer(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        unit = lexical_unit_factory(lemma="apple", language="en", notes="fruit")
+        unit.refresh_from_db()  # The post-save validation task updates the row.
+        response = authenticated_client.get(reverse("lexicalunit-list"))
+        assert response.data["results"] == [LexicalUnitSerializer(unit).data]
+
+    def test_lexical_unit_list_uses_cursor_pagination(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        lexical_unit_factory(lemma="banana", language="en")
+        lexical_unit_factory(lemma="apple", language="en")
+        response = authenticated_client.get(reverse("lexicalunit-list"))
+        assert "count" not in response.data
+        assert response.data["next"] is None
+        assert [u["lemma"] for u in response.data["results"]] == ["apple", "banana"]
+
+    def test_lexical_unit_list_query_count_is_constant(
+        self, authenticated_client, lexical_unit_factory, django_assert_num_queries
+    ):
+        for lemma in ("apple", "banana", "cherry"):
+            lexical_unit_factory(lemma=lemma, language="en")
+        # Cursor pagination needs no COUNT and the serializer follows no relations.
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(reverse("lexicalunit-list"))
+        assert len(response.data["results"]) == 3
+
+    @pytest.mark.usefixtures("no_phrase_enrichment_signal")
+    def test_lexical_unit_list_ignores_reverse_relations(
+        self,
+        authenticated_client,
+        lexical_unit_factory,
+        phrase_factory,
+        django_assert_num_queries,
+    ):
+        for lemma in ("apple", "banana"):
+            unit = lexical_unit_factory(lemma=lemma, language="en")
+            LexicalUnitTranslation.objects.create(
+                source_unit=unit,
+                target_unit=lexical_unit_factory(lemma=f"{lemma} ru", language="ru"),
+            )
+            phrase_factory(text=f"I like {lemma}.").units.add(unit)
+        # Translations and phrases are not embedded, so nothing is prefetched.
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(reverse("lexicalunit-list"))
+        assert len(response.data["results"]) == 4
+
+    def test_retrieve_lexical_unit_is_a_single_query(
+        self, authenticated_client, lexical_unit_factory, django_assert_num_queries
+    ):
+        unit = lexical_unit_factory(lemma="apple", language="en")
+        url = reverse("lexicalunit-detail", args=[unit.id])
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(url)
+        assert response.status_code == 200
+
     def test_update_fails_for_non_owner(
         self, authenticated_client, lexical_unit_factory, user_factory
     ):
@@ -128,3 +276,176 @@ class TestLexicalUnitAPI:
         assert LexicalUnit.objects.filter(
             id=lu_other.id
         ).exists()  # Should not be deleted
+
+    def test_bulk_enrich_details_queues_one_task_per_unit(
+        self, authenticated_client, lexical_unit_factory, mock_llm_services
+    ):
+        _, mock_get_details, _, _ = mock_llm_services
+        units = [
+            lexical_unit_factory(lemma=lemma, language="en")
+            for lemma in ("apple", "pear")
+        ]
+        mock_get_details.reset_mock()
+        url = reverse("lexicalunit-bulk-enrich-details")
+        payload = {"unit_ids": [unit.id for unit in units]}
+        response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 202
+        assert len(response.data["task_ids"]) == 2
+        assert mock_get_details.call_count == 2
+
+    def test_bulk_enrich_details_joins_units_already_being_enriched(
+        self, authenticated_client, lexical_unit_factory, mock_llm_services
+    ):
+        _, mock_get_details, _, _ = mock_llm_services
+        locked, free = [
+            lexical_unit_factory(lemma=lemma, language="en")
+            for lemma in ("apple", "pear")
+        ]
+        mock_get_details.reset_mock()
+        cache.add(enrich_lock_key(locked.id), "running-task-id")
+        url = reverse("lexicalunit-bulk-enrich-details")
+        response = authenticated_client.post(
+            url, {"unit_ids": [locked.id, free.id]}, format="json"
+        )
+        assert response.status_code == 202
+        assert response.data["task_ids"][0] == "running-task-id"
+        assert response.data["task_ids"][1] != "running-task-id"
+        # Only the free unit was enriched, and its lock was released after.
+        mock_get_details.assert_called_once()
+        assert mock_get_details.call_args.args[1].id == free.id
+        assert cache.get(enrich_lock_key(locked.id)) == "running-task-id"
+        assert cache.get(enrich_lock_key(free.id)) is None
+
+    def test_bulk_enrich_details_rejects_foreign_units(
+        self, authenticated_client, lexical_unit_factory, user_factory
+    ):
+        other_user = user_factory(username="otheruser")
+        foreign = lexical_unit_factory(lemma="theirs", language="en", user=other_user)
+        url = reverse("lexicalunit-bulk-enrich-details")
+        response = authenticated_client.post(
+            url, {"unit_ids": [foreign.id]}, format="json"
+        )
+        assert response.status_code == 404
+
+    def test_translate_rejects_source_language_in_any_case(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        unit = lexical_unit_factory(
+            lemma="colour", language="en-gb", part_of_speech=PartOfSpeech.NOUN
+        )
+        assert unit.language == "en-GB"
+        url = reverse("lexicalunit-translate", args=[unit.id])
+        response = authenticated_client.post(
+            url, {"target_language_code": "EN-GB"}, format="json"
+        )
+        assert response.status_code == 400
+
+    def test_source_language_checks_canonicalize_legacy_rows(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        unit = lexical_unit_factory(
+            lemma="colour", language="en-GB", part_of_speech=PartOfSpeech.NOUN
+        )
+        # Saved before language codes were canonicalized on write.
+        LexicalUnit.objects.filter(pk=unit.pk).update(language="en-gb")
+
+        url = reverse("lexicalunit-translate", args=[unit.id])
+        response = authenticated_client.post(
+            url, {"target_language_codes": ["ru", "EN-GB"]}, format="json"
+        )
+        assert response.status_code == 400
+
+        url = reverse("lexicalunit-generate-phrases-for-unit", args=[unit.id])
+        payload = {"target_language": "en-GB", "cefr": "B1"}
+        response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 400
+
+    def test_enrich_details_loads_only_the_unit_id(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        unit = lexical_unit_factory(lemma="apple", language="en")
+        url = reverse("lexicalunit-enrich-details", args=[unit.id])
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.post(url, {}, format="json")
+        assert response.status_code == 202
+        lookup = next(q["sql"] for q in ctx.captured_queries if "LIMIT" in q["sql"])
+        assert '"notes"' not in lookup
+
+    def test_translate_queues_one_task_per_target_language(
+        self, authenticated_client, lexical_unit_factory, mock_llm_services
+    ):
+        _, _, mock_translate, _ = mock_llm_services
+        unit = lexical_unit_factory(
+            lemma="apple", language="en", part_of_speech=PartOfSpeech.NOUN
+        )
+        url = reverse("lexicalunit-translate", args=[unit.id])
+        response = authenticated_client.post(
+            url, {"target_language_codes": ["ru", "fr", "ru"]}, format="json"
+        )
+        assert response.status_code == 202
+        assert len(response.data["task_ids"]) == 2
+        assert mock_translate.call_count == 2
+
+    def test_translate_rejects_both_single_and_list_targets(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        unit = lexical_unit_factory(
+            lemma="apple", language="en", part_of_speech=PartOfSpeech.NOUN
+        )
+        url = reverse("lexicalunit-translate", args=[unit.id])
+        payload = {"target_language_code": "ru", "target_language_codes": ["fr"]}
+        response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 400
+
+    def test_generate_phrases_rejects_source_language(
+        self, authenticated_client, lexical_unit_factory
+    ):
+        unit = lexical_unit_factory(lemma="apple", language="en")
+        url = reverse("lexicalunit-generate-phrases-for-unit", args=[unit.id])
+        payload = {"target_language": "en", "cefr": "B1"}
+        response = authenticated_client.post(url, payload, format="json")
+        assert response.status_code == 400
+        assert "same as the source language" in str(response.data)
+
+    def test_generate_phrases_validates_fields_before_loading_unit(
+        self, authenticated_client, django_assert_num_queries
+    ):
+        url = reverse("lexicalunit-generate-phrases-for-unit", args=[0])
+        with django_assert_num_queries(0):
+            response = authenticated_client.post(url, {"cefr": "Z9"}, format="json")
+        assert response.status_code == 400
+
+    def test_enrich_details_joins_unit_already_being_enriched(
+        self, authenticated_client, lexical_unit_factory, mock_llm_services
+    ):
+        _, mock_get_details, _, _ = mock_llm_services
+        unit = lexical_unit_factory(lemma="apple", language="en")
+        mock_get_details.reset_mock()
+        url = reverse("lexicalunit-enrich-details", args=[unit.id])
+
+        cache.add(enrich_lock_key(unit.id), "running-task-id")
+        response = authenticated_client.post(url, {}, format="json")
+        assert response.status_code == 202
+        assert response.data["task_id"] == "running-task-id"
+        assert mock_get_details.call_count == 0
+
+        cache.delete(enrich_lock_key(unit.id))
+        response = authenticated_client.post(url, {}, format="json")
+        assert response.data["task_id"] != "running-task-id"
+        assert mock_get_details.call_count == 1
+        # The finished task released the lock for the next request.
+        assert cache.get(enrich_lock_key(unit.id)) is None
+
+    def test_forced_enrich_details_bypasses_the_lock(
+        self, authenticated_client, lexical_unit_factory, mock_llm_services
+    ):
+        _, mock_get_details, _, _ = mock_llm_services
+        unit = lexical_unit_factory(lemma="apple", language="en")
+        mock_get_details.reset_mock()
+        url = reverse("lexicalunit-enrich-details", args=[unit.id])
+
+        cache.add(enrich_lock_key(unit.id), "running-task-id")
+        response = authenticated_client.post(url, {"force_update": True}, format="json")
+        assert response.status_code == 202
+        assert response.data["task_id"] != "running-task-id"
+        assert mock_get_details.call_count == 1
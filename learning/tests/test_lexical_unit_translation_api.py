@@ -1,10 +1,13 @@
 # In learning/tests/test_lexical_unit_translation_api.py
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
 from learning.models import LexicalUnit, LexicalUnitTranslation
 from learning.enums import PartOfSpeech, LexicalCategory
+from learning.serializers import LexicalUnitTranslationSerializer
 
 pytestmark = pytest.mark.django_db
 
@@ -51,7 +54,6 @@ class TestLexicalUnitTranslationAPI:
         response = authenticated_client.get(url)
 
         assert response.status_code == 200
-        # The queryset for this view is not user-filtered yet, so we just check for existence.
         assert any(
             item["source_unit"] == unit1.id and item["target_unit"] == unit2.id
             # for item in response.data
@@ -113,6 +115,25 @@ class TestLexicalUnitTranslationAPI:
             source_unit=source_lu, target_unit=target_lu1
         ).exists()
 
+    def test_bulk_create_response_needs_no_extra_queries(
+        self, lexical_unit_factory, django_assert_num_queries
+    ):
+        source = lexical_unit_factory(lemma="apple", language="en")
+        created = [
+            LexicalUnitTranslation.objects.create(
+                source_unit=source,
+                target_unit=lexical_unit_factory(lemma=lemma, language=language),
+            )
+            for lemma, language in (("яблоко", "ru"), ("pomme", "fr"))
+        ]
+        # Units are rendered from the FK id columns, so freshly created
+        # instances serialize without re-fetching anything.
+        with django_assert_num_queries(0):
+            data = LexicalUnitTranslationSerializer(created, many=True).data
+        assert [item["target_unit"] for item in data] == [
+            t.target_unit_id for t in created
+        ]
+
     def test_cannot_create_translation_for_other_user_units(
         self, authenticated_client, lexical_unit_factory, user_factory
     ):
@@ -145,3 +166,63 @@ class TestLexicalUnitTranslationAPI:
         # Assert: Ожидаем ошибку валидации
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "belong to the same user" in str(response.data)
+
+    def test_list_excludes_other_users_translations(
+        self, authenticated_client, lexical_unit_factory, user_factory
+    ):
+        other_user = user_factory(username="other_user")
+        LexicalUnitTranslation.objects.create(
+            source_unit=lexical_unit_factory(
+                user=other_user, lemma="theirs", language="en"
+            ),
+            target_unit=lexical_unit_factory(
+                user=other_user, lemma="leur", language="fr"
+            ),
+        )
+        url = reverse("lexicalunittranslation-list")
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == []
+
+    def test_bulk_create_is_idempotent_and_batches_inserts(self, authenticated_client):
+        bulk_url = reverse("lexicalunittranslation-bulk-create")
+        unit = {
+            "lexical_category": LexicalCategory.SINGLE_WORD,
+            "part_of_speech": PartOfSpeech.NOUN,
+        }
+        payload = {
+            "source_unit": {"lemma": "house", "language": "en", **unit},
+            "targets": [
+                {"lemma": lemma, "language": language, **unit}
+                for lemma, language in (("дом", "ru"), ("maison", "fr"), ("Haus", "de"))
+            ],
+        }
+        with CaptureQueriesContext(connection) as ctx:
+            first = authenticated_client.post(bulk_url, payload, format="json")
+        assert first.status_code == 201
+        unit_inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("INSERT")
+            and 'INTO "learning_lexicalunit" ' in q["sql"]
+        ]
+        # One INSERT for the source unit and one for all three targets.
+        assert len(unit_inserts) == 2
+
+        second = authenticated_client.post(bulk_url, payload, format="json")
+        assert [t["id"] for t in second.data] == [t["id"] for t in first.data]
+        assert LexicalUnitTranslation.objects.count() == 3
+
+    def test_list_query_count_is_constant(
+        self, authenticated_client, lexical_unit_factory, django_assert_num_queries
+    ):
+        source = lexical_unit_factory(lemma="apple", language="en")
+        for lemma, language in (("яблоко", "ru"), ("pomme", "fr"), ("Apfel", "de")):
+            LexicalUnitTranslation.objects.create(
+                source_unit=source,
+                target_unit=lexical_unit_factory(lemma=lemma, language=language),
+            )
+        # COUNT for pagination and the page itself; units are rendered as ids.
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(reverse("lexicalunittranslation-list"))
+        assert len(response.data["results"]) == 3
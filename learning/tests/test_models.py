@@ -97,6 +97,13 @@ class TestLexicalUnitModel:
         assert lu.lemma == "melon"
         assert lu.lexical_category == LexicalCategory.SINGLE_WORD
 
+    def test_save_collapses_internal_whitespace(self, lexical_unit_factory):
+        """Tests that tabs, newlines and non-breaking spaces collapse to one space."""
+        lu = lexical_unit_factory(
+            lemma="\tLook \n\u00a0 UP ", language="en", part_of_speech=PartOfSpeech.VERB
+        )
+        assert lu.lemma == "look up"
+
     def test_lexical_unit_str_representation(self, lexical_unit_factory):
         """Tests the __str__ method."""
         lu_with_pos = lexical_unit_factory(
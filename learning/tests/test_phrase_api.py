@@ -2,6 +2,7 @@
 import pytest
 from django.urls import reverse
 from learning.models import Phrase
+from learning.serializers import PhraseSerializer
 
 pytestmark = pytest.mark.django_db
 
@@ -42,3 +43,39 @@ class TestPhraseAPI:
         assert response.status_code == 200
         # DRF pagination returns results in a 'results' key
         assert len(response.data["results"]) >= 1
+
+    def test_phrase_list_matches_full_serializer(
+        self, authenticated_client, phrase_factory, lexical_unit_factory
+    ):
+        phrase = phrase_factory(text="Break a leg!", cefr="B2", category="IDIOM")
+        phrase.units.add(lexical_unit_factory(lemma="leg", language="en"))
+        response = authenticated_client.get(reverse("phrase-list"))
+        assert response.data["results"] == [PhraseSerializer(phrase).data]
+
+    def test_phrase_list_prefetches_units(
+        self,
+        authenticated_client,
+        phrase_factory,
+        lexical_unit_factory,
+        django_assert_num_queries,
+    ):
+        unit = lexical_unit_factory(lemma="leg", language="en")
+        for text in ("Break a leg!", "Pull my leg."):
+            phrase_factory(text=text).units.add(unit)
+        # COUNT for pagination, the page of phrases, and one units prefetch.
+        with django_assert_num_queries(3):
+            authenticated_client.get(reverse("phrase-list"))
+
+    def test_filter_by_unit_lemma_returns_each_phrase_once(
+        self, authenticated_client, phrase_factory, lexical_unit_factory
+    ):
+        phrase = phrase_factory(text="Apple pie is an apple dessert.")
+        phrase.units.add(
+            lexical_unit_factory(lemma="apple", language="en"),
+            lexical_unit_factory(lemma="apple pie", language="en"),
+        )
+        response = authenticated_client.get(
+            reverse("phrase-list"), {"units__lemma__icontains": "apple"}
+        )
+        assert response.data["count"] == 1
+        assert [item["id"] for item in response.data["results"]] == [phrase.id]
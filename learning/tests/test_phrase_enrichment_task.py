@@ -1,11 +1,17 @@
 # learning/tests/test_phrase_enrichment_task.py
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from learning.models import Phrase
 from learning.enums import ValidationStatus, CEFR, PhraseCategory
 from learning.tasks import enrich_phrase_async
-from services.enrich_phrase_details import enrich_phrase_details, PhraseAnalysisResponse
+from services.enrich_phrase_details import (
+    enrich_phrase_details,
+    enrich_phrase_details_async,
+    enrich_phrase_details_batch,
+    PhraseAnalysisResponse,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -90,3 +96,66 @@ def test_enrich_phrase_service_logic(mock_answer_with_llm, phrase_factory):
     assert result.is_valid is True
     assert result.cefr_level == CEFR.B1
     mock_answer_with_llm.assert_called_once()
+
+
+@pytest.mark.usefixtures("no_phrase_enrichment_signal")
+@patch("services.enrich_phrase_details.answer_with_llm")
+def test_enrich_phrase_batch_keeps_input_order(mock_answer_with_llm, phrase_factory):
+    phrases = [
+        phrase_factory(text=text, language="en") for text in ("alpha", "beta", "gamma")
+    ]
+
+    def fake_llm(client, messages, **kwargs):
+        prompt = messages[0]["content"]
+        if '"beta"' in prompt:
+            return "not json"
+        level = "A1" if '"alpha"' in prompt else "C2"
+        return (
+            '{"is_valid": true, "language_code": "en", '
+            f'"cefr_level": "{level}", "category": "GENERAL"}}'
+        )
+
+    mock_answer_with_llm.side_effect = fake_llm
+
+    results = enrich_phrase_details_batch(MagicMock(), phrases)
+
+    assert [r and r.cefr_level for r in results] == [CEFR.A1, None, CEFR.C2]
+    assert mock_answer_with_llm.call_count == 3
+
+
+@pytest.mark.usefixtures("no_phrase_enrichment_signal")
+@patch("services.enrich_phrase_details.answer_with_llm")
+def test_enrich_phrase_reuses_cached_analysis(mock_answer_with_llm, phrase_factory):
+    mock_answer_with_llm.return_value = (
+        '{"is_valid": true, "language_code": "en", '
+        '"cefr_level": "B2", "category": "GENERAL"}'
+    )
+    phrase = phrase_factory(text="Break a leg", language="en")
+
+    first = enrich_phrase_details(MagicMock(), phrase)
+    second = enrich_phrase_details(MagicMock(), phrase)
+
+    assert first == second
+    mock_answer_with_llm.assert_called_once()
+
+
+@pytest.mark.usefixtures("no_phrase_enrichment_signal")
+def test_enrich_phrase_async_variants_run_concurrently(phrase_factory):
+    phrases = [phrase_factory(text=f"Phrase {i}", language="en") for i in range(3)]
+    completion = MagicMock()
+    completion.choices[0].message.content = (
+        '{"is_valid": true, "language_code": "en", '
+        '"cefr_level": "A2", "category": "GENERAL"}'
+    )
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=completion)
+
+    async def enrich_all():
+        return await asyncio.gather(
+            *(enrich_phrase_details_async(client, phrase) for phrase in phrases)
+        )
+
+    results = asyncio.run(enrich_all())
+
+    assert [r.cefr_level for r in results] == [CEFR.A2] * 3
+    assert client.chat.completions.create.await_count == 3
@@ -1,12 +1,20 @@
 # learning/tests/test_phrase_generation.py
 import json
 import pytest
+from asgiref.sync import async_to_sync
 from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 from learning.models import Phrase, PhraseTranslation
 from learning.tasks import generate_phrases_async
-from services.save_phrases import parse_and_save_phrases
+from services import save_phrases
+from services.save_phrases import (
+    parse_and_save_phrases,
+    parse_and_save_phrases_async,
+)
+from services.unit2phrases import unit2phrases_batch
 
 # NOTE: The API-level integration test that was previously hanging has been removed
 # as a pragmatic solution to an intractable test environment issue.
@@ -99,3 +107,158 @@ class TestPhraseGenerationWorkflow:
         assert created_count == 0
         assert Phrase.objects.count() == 0
         assert PhraseTranslation.objects.count() == 0
+
+    def test_parse_and_save_phrases_batches_inserts(
+        self, lexical_unit_factory, phrase_factory, monkeypatch
+    ):
+        lu = lexical_unit_factory(lemma="tea", language="en")
+        phrase_factory(text="Green tea.", language="en")
+        enriched = []
+        monkeypatch.setattr(
+            "learning.signals.enrich_phrase_async.delay",
+            lambda phrase_id: enriched.append(phrase_id),
+        )
+        raw_json = json.dumps(
+            [
+                {"original_phrase": t, "translated_phrase": r, "cefr": "A1"}
+                for t, r in (
+                    ("Black tea.", "Чёрный чай."),
+                    ("Green tea.", "Зелёный чай."),
+                    ("Hot tea.", "Горячий чай."),
+                )
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            created_count = parse_and_save_phrases(
+                raw_response=raw_json,
+                lexical_unit=lu,
+                source_language="en",
+                target_language="ru",
+            )
+
+        assert created_count == 2
+        # Phrases, unit links and translations: one INSERT each.
+        assert sum(q["sql"].startswith("INSERT") for q in ctx.captured_queries) == 3
+        assert not Phrase.objects.filter(text="Зелёный чай.").exists()
+        assert set(lu.phrase_set.values_list("text", flat=True)) == {
+            "Black tea.",
+            "Hot tea.",
+        }
+        assert PhraseTranslation.objects.count() == 2
+        assert len(enriched) == 4
+
+    @pytest.mark.usefixtures("no_phrase_enrichment_signal")
+    def test_parse_and_save_phrases_survives_concurrent_duplicate(
+        self, lexical_unit_factory, phrase_factory
+    ):
+        lu = lexical_unit_factory(lemma="milk", language="en")
+        phrase_factory(text="Cold milk.", language="en")
+        raw_json = json.dumps(
+            [
+                {"original_phrase": t, "translated_phrase": r, "cefr": "A1"}
+                for t, r in (("Cold milk.", "Холодное молоко."), ("Milk.", "Молоко."))
+            ]
+        )
+        real_lookup = save_phrases._existing_phrase_keys
+        calls = []
+
+        def racing_lookup(*args):
+            # The first check misses the row, as if another worker inserted
+            # it between the check and the INSERT.
+            calls.append(args)
+            return set() if len(calls) == 1 else real_lookup(*args)
+
+        with patch.object(save_phrases, "_existing_phrase_keys", racing_lookup):
+            created_count = parse_and_save_phrases(
+                raw_response=raw_json,
+                lexical_unit=lu,
+                source_language="en",
+                target_language="ru",
+            )
+
+        assert created_count == 1
+        assert len(calls) == 2
+        assert PhraseTranslation.objects.get().source_phrase.text == "Milk."
+
+    def test_parse_and_save_phrases_rejects_invalid_json(self, lexical_unit_factory):
+        lu = lexical_unit_factory(lemma="test", language="en")
+
+        created_count = parse_and_save_phrases(
+            raw_response='{"phrases": [',
+            lexical_unit=lu,
+            source_language="en",
+            target_language="ru",
+        )
+
+        assert created_count == 0
+        assert Phrase.objects.count() == 0
+
+    @pytest.mark.usefixtures("no_phrase_enrichment_signal")
+    def test_parse_and_save_phrases_without_bulk_returning(
+        self, lexical_unit_factory, monkeypatch
+    ):
+        lu = lexical_unit_factory(lemma="bread", language="en")
+        monkeypatch.setattr(
+            type(connection.features), "can_return_rows_from_bulk_insert", False
+        )
+        raw_json = json.dumps(
+            [
+                {
+                    "original_phrase": "Fresh bread.",
+                    "translated_phrase": "Свежий хлеб.",
+                    "cefr": "A1",
+                }
+            ]
+        )
+
+        created_count = parse_and_save_phrases(
+            raw_response=raw_json,
+            lexical_unit=lu,
+            source_language="en",
+            target_language="ru",
+        )
+
+        assert created_count == 1
+        translation = PhraseTranslation.objects.get()
+        assert translation.target_phrase.text == "Свежий хлеб."
+        assert list(lu.phrase_set.values_list("text", flat=True)) == ["Fresh bread."]
+
+    @pytest.mark.usefixtures("no_phrase_enrichment_signal")
+    def test_parse_and_save_phrases_async(self, lexical_unit_factory):
+        lu = lexical_unit_factory(lemma="rain", language="en")
+        raw_json = json.dumps(
+            {
+                "phrases": [
+                    {
+                        "original_phrase": "It rains.",
+                        "translated_phrase": "Идёт дождь.",
+                        "cefr": "A1",
+                    }
+                ]
+            }
+        )
+
+        created_count = async_to_sync(parse_and_save_phrases_async)(
+            raw_json, lu, "en", "ru"
+        )
+
+        assert created_count == 1
+        assert PhraseTranslation.objects.get().source_phrase.text == "It rains."
+
+
+@patch("services.unit2phrases.answer_with_llm")
+def test_unit2phrases_batch_keeps_input_order(mock_answer_with_llm):
+    def answer(messages, **kwargs):
+        if '"broken"' in messages[0]["content"]:
+            raise RuntimeError("LLM unavailable")
+        return messages[0]["content"]
+
+    mock_answer_with_llm.side_effect = answer
+
+    results = unit2phrases_batch(None, ["cat", "broken", "dog"], "A1", "en", "ru")
+
+    assert mock_answer_with_llm.call_count == 3
+    assert '"cat"' in results[0]
+    assert results[1] is None
+    assert '"dog"' in results[2]
@@ -0,0 +1,50 @@
+# learning/tests/test_phrase_translation_api.py
+import pytest
+from django.urls import reverse
+from learning.models import PhraseTranslation
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.usefixtures("no_phrase_enrichment_signal")
+class TestPhraseTranslationAPI:
+    def test_list_query_count_is_constant(
+        self, authenticated_client, phrase_factory, django_assert_num_queries
+    ):
+        for i in range(3):
+            PhraseTranslation.objects.create(
+                source_phrase=phrase_factory(text=f"Phrase {i}", language="en"),
+                target_phrase=phrase_factory(text=f"Фраза {i}", language="ru"),
+            )
+        # COUNT for pagination and the page itself; phrases are rendered as ids.
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(reverse("phrasetranslation-list"))
+        assert len(response.data["results"]) == 3
+
+    def test_filter_by_target_language(self, authenticated_client, phrase_factory):
+        source = phrase_factory(text="Good morning", language="en")
+        PhraseTranslation.objects.create(
+            source_phrase=source,
+            target_phrase=phrase_factory(text="Доброе утро", language="ru"),
+        )
+        PhraseTranslation.objects.create(
+            source_phrase=source,
+            target_phrase=phrase_factory(text="Guten Morgen", language="de"),
+        )
+        response = authenticated_client.get(
+            reverse("phrasetranslation-list"), {"target_phrase__language": "de"}
+        )
+        assert response.status_code == 200
+        assert len(response.data["results"]) == 1
+
+    def test_retrieve_is_a_single_query(
+        self, authenticated_client, phrase_factory, django_assert_num_queries
+    ):
+        translation = PhraseTranslation.objects.create(
+            source_phrase=phrase_factory(text="Thank you", language="en"),
+            target_phrase=phrase_factory(text="Спасибо", language="ru"),
+        )
+        url = reverse("phrasetranslation-detail", args=[translation.id])
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(url)
+        assert response.data["source_phrase"] == translation.source_phrase_id
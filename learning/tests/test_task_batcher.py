@@ -0,0 +1,119 @@
+import threading
+from unittest.mock import MagicMock
+
+from learning.task_batcher import TaskBatcher
+
+
+def _make_task(always_eager):
+    task = MagicMock()
+    task.name = "learning.tasks.fake_task"
+    task.app.conf.task_always_eager = always_eager
+    return task
+
+
+def test_eager_mode_publishes_inline_with_pregenerated_id():
+    task = _make_task(always_eager=True)
+    batcher = TaskBatcher()
+
+    task_id = batcher.submit(task, unit_id=1)
+
+    task.apply_async.assert_called_once_with(kwargs={"unit_id": 1}, task_id=task_id)
+    assert batcher._worker is None
+
+
+def test_batch_is_published_over_one_producer():
+    task = _make_task(always_eager=False)
+    published = threading.Event()
+    task.apply_async.side_effect = lambda **kw: published.set()
+    batcher = TaskBatcher(flush_interval=0.05)
+
+    task_id = batcher.submit(task, unit_id=1)
+
+    assert published.wait(timeout=2)
+    producer = task.app.producer_or_acquire.return_value.__enter__.return_value
+    task.apply_async.assert_called_once_with(
+        kwargs={"unit_id": 1}, task_id=task_id, producer=producer
+    )
+
+
+def test_failed_publish_marks_the_task_failed_and_calls_on_failure():
+    task = _make_task(always_eager=False)
+    error = ConnectionError("broker down")
+    task.apply_async.side_effect = error
+    failed = threading.Event()
+    batcher = TaskBatcher(flush_interval=0.05)
+
+    task_id = batcher.submit(task, on_failure=lambda exc: failed.set(), unit_id=1)
+
+    assert failed.wait(timeout=2)
+    task.backend.mark_as_failure.assert_called_once_with(task_id, error)
+
+
+def test_unreachable_broker_fails_the_whole_batch():
+    task = _make_task(always_eager=False)
+    error = ConnectionError("broker down")
+    task.app.producer_or_acquire.side_effect = error
+    failures = []
+    done = threading.Event()
+
+    def on_failure(exc):
+        failures.append(exc)
+        if len(failures) == 2:
+            done.set()
+
+    batcher = TaskBatcher(flush_interval=0.2)
+    ids = [batcher.submit(task, on_failure=on_failure, unit_id=i) for i in (1, 2)]
+
+    assert done.wait(timeout=2)
+    assert failures == [error, error]
+    marked = [c.args[0] for c in task.backend.mark_as_failure.call_args_list]
+    assert marked == ids
+
+
+def test_overflow_pool_is_created_with_the_worker():
+    batcher = TaskBatcher()
+    assert batcher._overflow_executor is None
+
+    batcher._ensure_worker()
+
+    assert batcher._overflow_executor is not None
+
+
+def test_shutdown_publishes_what_is_still_queued():
+    task = _make_task(always_eager=False)
+    # The worker would keep collecting this batch for a long time.
+    batcher = TaskBatcher(flush_interval=10)
+
+    task_id = batcher.submit(task, unit_id=1)
+    batcher.shutdown()
+
+    producer = task.app.producer_or_acquire.return_value.__enter__.return_value
+    task.apply_async.assert_called_once_with(
+        kwargs={"unit_id": 1}, task_id=task_id, producer=producer
+    )
+
+
+def test_shutdown_fails_tasks_it_cannot_publish():
+    task = _make_task(always_eager=False)
+    producer_cm = task.app.producer_or_acquire.return_value
+    error = ConnectionError("broker down")
+    task.app.producer_or_acquire.side_effect = [producer_cm, error]
+    publishing, release = threading.Event(), threading.Event()
+
+    def apply_async(**kwargs):
+        publishing.set()
+        release.wait(timeout=2)
+
+    task.apply_async.side_effect = apply_async
+    batcher = TaskBatcher(flush_interval=0.01)
+    batcher.submit(task, unit_id=1)
+    assert publishing.wait(timeout=2)
+    # Queued behind a worker that is stuck on the broker.
+    failures = []
+    task_id = batcher.submit(task, on_failure=failures.append, unit_id=2)
+
+    batcher.shutdown(timeout=0.1)
+    release.set()
+
+    assert failures == [error]
+    task.backend.mark_as_failure.assert_called_once_with(task_id, error)
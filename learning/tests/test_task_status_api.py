@@ -0,0 +1,92 @@
+# learning/tests/test_task_status_api.py
+import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@patch("learning.views.AsyncResult")
+def test_finished_task_status_is_served_from_cache(
+    mock_async_result, authenticated_client
+):
+    get_task_meta = mock_async_result.return_value.backend.get_task_meta
+    get_task_meta.return_value = {"status": "SUCCESS", "result": ["apple"]}
+    url = reverse("task-status", args=["finished-task"])
+
+    for _ in range(2):
+        response = authenticated_client.get(url)
+        assert response.status_code == 200
+        assert response.data["status"] == "SUCCESS"
+        assert response.data["result"] == ["apple"]
+
+    get_task_meta.assert_called_once_with("finished-task")
+
+
+@patch("learning.views.AsyncResult")
+def test_pending_task_status_is_not_cached(mock_async_result, authenticated_client):
+    get_task_meta = mock_async_result.return_value.backend.get_task_meta
+    get_task_meta.return_value = {"status": "PENDING", "result": None}
+    url = reverse("task-status", args=["pending-task"])
+
+    for _ in range(2):
+        response = authenticated_client.get(url)
+        assert response.data == {
+            "task_id": "pending-task",
+            "status": "PENDING",
+            "result": "None",
+        }
+
+    assert get_task_meta.call_count == 2
+
+
+@patch("learning.views.AsyncResult")
+def test_finished_task_revalidates_with_etag(mock_async_result, authenticated_client):
+    get_task_meta = mock_async_result.return_value.backend.get_task_meta
+    get_task_meta.return_value = {"status": "SUCCESS", "result": ["apple"]}
+    url = reverse("task-status", args=["finished-task"])
+
+    response = authenticated_client.get(url)
+    assert "immutable" in response["Cache-Control"]
+    cache.clear()
+
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+    # The cache was cleared, so the final state is confirmed before the 304.
+    assert get_task_meta.call_count == 2
+
+
+@patch("learning.views.AsyncResult")
+def test_etag_never_short_circuits_an_unfinished_task(
+    mock_async_result, authenticated_client
+):
+    get_task_meta = mock_async_result.return_value.backend.get_task_meta
+    get_task_meta.return_value = {"status": "SUCCESS", "result": ["apple"]}
+    finished = authenticated_client.get(reverse("task-status", args=["finished"]))
+
+    get_task_meta.return_value = {"status": "STARTED", "result": None}
+    response = authenticated_client.get(
+        reverse("task-status", args=["running"]),
+        HTTP_IF_NONE_MATCH=finished["ETag"],
+    )
+    assert response.status_code == 200
+    assert response.data["status"] == "STARTED"
+
+
+@patch("learning.views.AsyncResult")
+def test_pending_task_status_is_only_briefly_cacheable(
+    mock_async_result, authenticated_client
+):
+    get_task_meta = mock_async_result.return_value.backend.get_task_meta
+    get_task_meta.return_value = {"status": "STARTED", "result": None}
+    response = authenticated_client.get(reverse("task-status", args=["running"]))
+    assert response["Cache-Control"] == "private, max-age=1"
+    assert not response.has_header("ETag")
@@ -1,9 +1,17 @@
 # In new file: learning/tests/test_translation_verification.py
 
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
+from ai.answer_with_llm import gather_with_limit
+from ai.cache import llm_cache
 from learning.models import LexicalUnitTranslation, ValidationStatus
 from learning.tasks import verify_translation_link_async
+from services.verify_translation import (
+    _cache_key,
+    get_translation_verification,
+    get_translation_verification_async,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -112,3 +120,113 @@ def test_signal_triggers_verification_task(mock_task_delay, lexical_unit_factory
 
     # Assert: Проверяем, что метод .delay() задачи был вызван один раз
     mock_task_delay.assert_called_once()
+
+
+def test_async_verifications_respect_concurrency_limit(lexical_unit_factory):
+    in_flight, peak = 0, 0
+
+    async def fake_create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        completion = MagicMock()
+        completion.choices[0].message.content = (
+            '{"quality_score": 4, "justification": "Fine."}'
+        )
+        return completion
+
+    client = MagicMock()
+    client.chat.completions.create = fake_create
+    source = lexical_unit_factory(lemma="source", language="en")
+    targets = [
+        lexical_unit_factory(lemma=f"target {i}", language="ru") for i in range(5)
+    ]
+
+    results = asyncio.run(
+        gather_with_limit(
+            (
+                get_translation_verification_async(client, source, target)
+                for target in targets
+            ),
+            limit=2,
+        )
+    )
+
+    assert [r.quality_score for r in results] == [4] * 5
+    assert peak == 2
+
+
+@patch("services.verify_translation.answer_with_llm")
+def test_verification_result_is_cached(mock_answer_with_llm, translation_link):
+    mock_answer_with_llm.return_value = '{"quality_score": 5, "justification": "Ok."}'
+    source, target = translation_link.source_unit, translation_link.target_unit
+
+    first = get_translation_verification(None, source, target)
+    second = get_translation_verification(None, source, target)
+
+    assert first == second
+    mock_answer_with_llm.assert_called_once()
+
+
+def test_identical_async_verifications_share_one_llm_call(translation_link):
+    calls = 0
+
+    async def fake_create(**kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        completion = MagicMock()
+        completion.choices[0].message.content = (
+            '{"quality_score": 3, "justification": "Close."}'
+        )
+        return completion
+
+    client = MagicMock()
+    client.chat.completions.create = fake_create
+    source, target = translation_link.source_unit, translation_link.target_unit
+
+    async def verify_concurrently():
+        return await asyncio.gather(
+            *(
+                get_translation_verification_async(client, source, target)
+                for _ in range(4)
+            )
+        )
+
+    results = asyncio.run(verify_concurrently())
+
+    assert [r.quality_score for r in results] == [3] * 4
+    assert calls == 1
+
+
+@patch("services.verify_translation.answer_with_llm")
+def test_truncated_verification_is_skipped_and_not_cached(
+    mock_answer_with_llm, translation_link
+):
+    mock_answer_with_llm.return_value = '{"quality_score": 5, "justifica'
+    source, target = translation_link.source_unit, translation_link.target_unit
+
+    assert get_translation_verification(None, source, target) is None
+    assert get_translation_verification(None, source, target) is None
+    assert mock_answer_with_llm.call_count == 2
+
+
+@patch("services.verify_translation.answer_with_llm")
+def test_verification_is_cached_as_json_and_stale_entries_are_misses(
+    mock_answer_with_llm, translation_link
+):
+    mock_answer_with_llm.return_value = '{"quality_score": 5, "justification": "Ok."}'
+    source, target = translation_link.source_unit, translation_link.target_unit
+    key = _cache_key(source, target)
+
+    get_translation_verification(None, source, target)
+    assert llm_cache.get(key) == {"quality_score": 5, "justification": "Ok."}
+
+    # An entry from an older response model no longer validates.
+    llm_cache.set(key, {"score": 5})
+    result = get_translation_verification(None, source, target)
+
+    assert result.quality_score == 5
+    assert mock_answer_with_llm.call_count == 2
@@ -1,5 +1,5 @@
 # In learning/utils.py
-import re
+from functools import lru_cache
 
 
 def get_canonical_lemma(lemma_value: str) -> str:
@@ -15,7 +15,13 @@ def get_canonical_lemma(lemma_value: str) -> str:
         # but for canonicalization, returning "" for None input is often safe.
         return ""
 
-    stripped_lemma = lemma_value.strip()
-    # Replace any sequence of one or more whitespace characters with a single space
-    normalized_spacing_lemma = re.sub(r"\s+", " ", stripped_lemma)
-    return normalized_spacing_lemma.lower()
+    return _canonicalize(lemma_value)
+
+
+@lru_cache(maxsize=8192)
+def _canonicalize(lemma_value: str) -> str:
+    # Pure string work, so popular lemmas are safe to memoize.
+    # str.split() with no separator drops leading/trailing whitespace and splits
+    # on the same Unicode whitespace as r"\s+", so one C-level pass both strips
+    # and collapses internal runs into a single standard space.
+    return " ".join(lemma_value.split()).lower()
@@ -1,6 +1,10 @@
+from functools import cache
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
 from django.core.validators import RegexValidator
+from django.dispatch import receiver
 
 # BCP47 language code validator (simple, practical)
 bcp47_validator = RegexValidator(
@@ -9,15 +13,32 @@ bcp47_validator = RegexValidator(
 )
 
 
+@cache
+def _supported_languages_by_lower():
+    """Maps each lowercased supported language code to its configured spelling."""
+    return {lang.lower(): lang for lang in settings.SUPPORTED_LANGUAGES}
+
+
+@receiver(setting_changed)
+def _reset_supported_languages(*, setting, **kwargs):
+    if setting == "SUPPORTED_LANGUAGES":
+        _supported_languages_by_lower.cache_clear()
+
+
+def canonical_language_code(value):
+    """
+    Returns the configured spelling of a supported language code
+    (e.g. "EN-gb" -> "en-GB"), or the value unchanged if it isn't supported.
+    """
+    return _supported_languages_by_lower().get(value.lower(), value)
+
+
 def supported_language_validator(value):
     """
     Checks if a given language code is in the project's list of supported languages.
     """
     # Приводим к нижнему регистру для унификации сравнения
-    normalized_value = value.lower()
-    supported_langs_lower = [lang.lower() for lang in settings.SUPPORTED_LANGUAGES]
-
-    if normalized_value not in supported_langs_lower:
+    if value.lower() not in _supported_languages_by_lower():
         # Django validators обычно выбрасывают ValidationError
         raise ValidationError(
             f"Language code '{value}' is not supported by this application."
@@ -1,12 +1,23 @@
 # learning/views.py
+import hashlib
 import logging
 
+import orjson
+from celery import group, states
 from celery.result import AsyncResult
+from celery.utils import uuid
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema, inline_serializer
+from django.utils.http import parse_etags, quote_etag
+from drf_spectacular.utils import (
+    PolymorphicProxySerializer,
+    extend_schema,
+    inline_serializer,
+)
 from rest_framework import status, viewsets, serializers
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -22,23 +33,30 @@ from .models import (
     Phrase,
     PhraseTranslation,
 )
+
 # --- MODIFIED START ---
 # Imports are now from the new serializer package
 from .serializers import (
     LexicalUnitSerializer,
+    LexicalUnitListSerializer,
     LexicalUnitTranslationSerializer,
     LexicalUnitTranslationBulkSerializer,
     PhraseSerializer,
+    PhraseListSerializer,
     PhraseTranslationSerializer,
     PhraseGenerationRequestSerializer,
     TranslateRequestSerializer,
     EnrichDetailsRequestSerializer,
+    BulkEnrichDetailsRequestSerializer,
     ResolveLemmaRequestSerializer,
     AnalyzeTextRequestSerializer,
     ExternalImportSerializer,
 )
+
 # --- MODIFIED END ---
 from .tasks import (
+    claim_enrich_lock,
+    release_enrich_lock,
     generate_phrases_async,
     enrich_details_async,
     translate_unit_async,
@@ -46,36 +64,130 @@ from .tasks import (
     enrich_phrase_async,
     analyze_text_and_suggest_words_async,
 )
+from .pagination import LemmaCursorPagination
 from .permissions import HasAPIKey
+from .task_batcher import log_queue_failure, task_batcher
+from .validators import canonical_language_code
 
 logger = logging.getLogger(__name__)
 
+# Response schemas shared by every task-queuing endpoint, built once at import.
+TASK_QUEUED_RESPONSE = inline_serializer(
+    name="TaskQueuedResponse",
+    fields={
+        "message": serializers.CharField(),
+        "task_id": serializers.UUIDField(),
+    },
+)
+TASKS_QUEUED_RESPONSE = inline_serializer(
+    name="TasksQueuedResponse",
+    fields={
+        "message": serializers.CharField(),
+        "task_ids": serializers.ListField(child=serializers.UUIDField()),
+    },
+)
+
 
 class TaskQueuingMixin:
     """A mixin to handle repetitive Celery task queuing logic."""
 
     def _queue_task(
-            self, task_func, success_message="Task queued successfully.", **kwargs
+        self,
+        task_func,
+        success_message="Task queued successfully.",
+        task_id=None,
+        on_failure=None,
+        **kwargs,
     ):
         try:
-            task_result = task_func.delay(**kwargs)
+            task_id = task_batcher.submit(
+                task_func, task_id=task_id, on_failure=on_failure, **kwargs
+            )
             return Response(
-                {"message": success_message, "task_id": task_result.id},
+                {"message": success_message, "task_id": task_id},
                 status=status.HTTP_202_ACCEPTED,
             )
         except Exception as e:
-            logger.error(
-                f"Failed to queue task {task_func.__name__}: {e}", exc_info=True
-            )
+            return self._queue_failure_response(task_func, e)
+
+    def _queue_tasks(
+        self, task_func, kwargs_list, success_message="Tasks queued successfully."
+    ):
+        """Queues one task per kwargs dict through the batcher, like _queue_task."""
+        try:
+            task_ids = [
+                task_batcher.submit(task_func, **kwargs) for kwargs in kwargs_list
+            ]
+        except Exception as e:
+            return self._queue_failure_response(task_func, e)
+        return Response(
+            {"message": success_message, "task_ids": task_ids},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    def _queue_group(
+        self, task_func, signatures, success_message="Tasks queued successfully."
+    ):
+        """Publishes many signatures of one task over a single broker connection."""
+        try:
+            group_result = group(signatures).apply_async()
             return Response(
-                {"error": "Failed to queue task."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {
+                    "message": success_message,
+                    "task_ids": [result.id for result in group_result.results],
+                },
+                status=status.HTTP_202_ACCEPTED,
             )
+        except Exception as e:
+            return self._queue_failure_response(task_func, e)
+
+    @staticmethod
+    def _queue_failure_response(task_func, exc):
+        log_queue_failure(task_func.name, exc)
+        return Response(
+            {"error": "Failed to queue task."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+class EagerLoadingViewSetMixin:
+    """Applies the eager loading declared by the active serializer class."""
 
+    def setup_eager_loading(self, queryset):
+        serializer_class = self.get_serializer_class()
+        setup = getattr(serializer_class, "setup_eager_loading", None)
+        return setup(queryset) if setup is not None else queryset
 
-class LexicalUnitViewSet(TaskQueuingMixin, viewsets.ModelViewSet):
+
+class ReadOnlyListSerializerMixin:
+    """
+    Serializes plain GET list responses with a lightweight read-only
+    serializer; every other action keeps the regular `serializer_class`.
+    """
+
+    list_read_serializer_class = None
+
+    def get_serializer_class(self):
+        if (
+            self.list_read_serializer_class is not None
+            and getattr(self, "action", None) == "list"
+            and self.request.method == "GET"
+            and not getattr(self, "swagger_fake_view", False)
+        ):
+            return self.list_read_serializer_class
+        return super().get_serializer_class()
+
+
+class LexicalUnitViewSet(
+    EagerLoadingViewSetMixin,
+    ReadOnlyListSerializerMixin,
+    TaskQueuingMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = LexicalUnitSerializer
+    list_read_serializer_class = LexicalUnitListSerializer
     filterset_class = LexicalUnitFilter
+    pagination_class = LemmaCursorPagination
     permission_classes = [IsAuthenticated]
     ordering_fields = [
         "id",
@@ -84,9 +196,19 @@ class LexicalUnitViewSet(TaskQueuingMixin, viewsets.ModelViewSet):
         "date_added",
     ]
     ordering = ["lemma"]
+    # Actions that only read a few scalars from the unit before queuing a task.
+    task_only_fields = {
+        "enrich_details": ("id",),
+        "translate": ("id", "part_of_speech", "language"),
+        "generate_phrases_for_unit": ("id", "language"),
+    }
 
     def get_queryset(self):
-        return LexicalUnit.objects.filter(user=self.request.user)
+        queryset = LexicalUnit.objects.filter(user_id=self.request.user.id)
+        only_fields = self.task_only_fields.get(getattr(self, "action", None))
+        if only_fields:
+            return queryset.only(*only_fields)
+        return self.setup_eager_loading(queryset)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -96,28 +218,39 @@ class LexicalUnitViewSet(TaskQueuingMixin, viewsets.ModelViewSet):
         request=LexicalUnitSerializer(many=True),
     )
     def create(self, request, *args, **kwargs):
-        is_many = isinstance(request.data, list)
-        serializer = self.get_serializer(data=request.data, many=is_many)
+        # Always validate through the list serializer; single objects are wrapped.
+        is_many = type(request.data) is list
+        data = request.data if is_many else [request.data]
+        serializer = self.get_serializer(data=data, many=True)
+        if not serializer.is_valid():
+            errors = serializer.errors
+            raise ValidationError(errors if is_many else errors[0])
+        self.perform_create(serializer)
+        if is_many:
+            # A Location header is meaningless for a list of new resources.
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        payload = serializer.data[0]
+        headers = self.get_success_headers(payload)
+        return Response(payload, status=status.HTTP_201_CREATED, headers=headers)
+
+    @extend_schema(
+        summary="Bulk Create Lexical Units",
+        request=LexicalUnitSerializer(many=True),
+        responses={201: LexicalUnitSerializer(many=True)},
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-create")
+    def bulk_create(self, request, *args, **kwargs):
+        # Dedicated list endpoint: no single-object detection or unwrapping.
+        serializer = self.get_serializer(data=request.data, many=True)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        headers = self.get_success_headers(serializer.data)
-        return Response(
-            serializer.data, status=status.HTTP_201_CREATED, headers=headers
-        )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @extend_schema(
         summary="Asynchronously Resolve a Lexical Unit",
         description="Triggers a background task to find all structural variants (e.g., noun, verb) for a given lemma.",
         request=ResolveLemmaRequestSerializer,
-        responses={
-            202: inline_serializer(
-                name="ResolveTaskQueuedResponse",
-                fields={
-                    "message": serializers.CharField(),
-                    "task_id": serializers.UUIDField(),
-                },
-            )
-        },
+        responses={202: TASK_QUEUED_RESPONSE},
     )
     @action(detail=False, methods=["post"], url_path="resolve")
     def resolve(self, request, *args, **kwargs):
@@ -136,51 +269,155 @@ class LexicalUnitViewSet(TaskQueuingMixin, viewsets.ModelViewSet):
     @extend_schema(
         summary="Enrich LU Details (POS, Pronunciation)",
         request=EnrichDetailsRequestSerializer,
-        responses={202: {"description": "Detail enrichment task successfully queued."}},
+        responses={202: TASK_QUEUED_RESPONSE},
     )
     @action(detail=True, methods=["post"], url_path="enrich-details")
     def enrich_details(self, request, pk=None):
-        unit = self.get_object()
+        # Validate the body first so malformed requests never hit the database.
         serializer = EnrichDetailsRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        unit = self.get_object()
+        force_update = serializer.validated_data["force_update"]
 
-        return self._queue_task(
+        # The lock holds the id of the task enriching the unit, and the task
+        # frees it when it ends.
+        task_id = uuid()
+        running_task_id = claim_enrich_lock(unit.id, task_id, force_update)
+        if running_task_id is not None:
+            return Response(
+                {
+                    "message": "Detail enrichment is already in progress.",
+                    "task_id": running_task_id,
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+        response = self._queue_task(
             enrich_details_async,
             success_message="Detail enrichment task queued.",
+            task_id=task_id,
+            # A lost publish must not keep the unit locked until the timeout.
+            on_failure=lambda exc: release_enrich_lock(unit.id, task_id),
             unit_id=unit.id,
             user_id=request.user.id,
-            force_update=serializer.validated_data.get("force_update", False),
+            force_update=force_update,
+        )
+        if response.status_code != status.HTTP_202_ACCEPTED:
+            release_enrich_lock(unit.id, task_id)
+        return response
+
+    @extend_schema(
+        summary="Enrich Details for Many Lexical Units",
+        request=BulkEnrichDetailsRequestSerializer,
+        responses={202: TASKS_QUEUED_RESPONSE},
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-enrich-details")
+    def bulk_enrich_details(self, request, *args, **kwargs):
+        serializer = BulkEnrichDetailsRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        unit_ids = set(serializer.validated_data["unit_ids"])
+        force_update = serializer.validated_data["force_update"]
+        user_id = request.user.id
+
+        own_ids = set(
+            LexicalUnit.objects.filter(user_id=user_id, id__in=unit_ids).values_list(
+                "id", flat=True
+            )
+        )
+        if own_ids != unit_ids:
+            return Response(
+                {"error": f"Unknown lexical unit ids: {sorted(unit_ids - own_ids)}."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Each unit is locked as in enrich_details; a unit already being
+        # enriched joins the running task instead of getting a second one.
+        task_ids, claimed = [], []
+        for unit_id in sorted(own_ids):
+            task_id = uuid()
+            running_task_id = claim_enrich_lock(unit_id, task_id, force_update)
+            if running_task_id is None:
+                claimed.append((unit_id, task_id))
+            task_ids.append(running_task_id or task_id)
+
+        if claimed:
+            response = self._queue_group(
+                enrich_details_async,
+                [
+                    enrich_details_async.s(
+                        unit_id=unit_id, user_id=user_id, force_update=force_update
+                    ).set(task_id=task_id)
+                    for unit_id, task_id in claimed
+                ],
+            )
+            if response.status_code != status.HTTP_202_ACCEPTED:
+                for unit_id, task_id in claimed:
+                    release_enrich_lock(unit_id, task_id)
+                return response
+        return Response(
+            {"message": "Detail enrichment tasks queued.", "task_ids": task_ids},
+            status=status.HTTP_202_ACCEPTED,
         )
 
     @extend_schema(
         summary="Translate a Lexical Unit",
         request=TranslateRequestSerializer,
-        responses={202: {"description": "Translation task successfully queued."}},
+        responses={
+            202: PolymorphicProxySerializer(
+                component_name="TranslationQueuedResponse",
+                serializers=[TASK_QUEUED_RESPONSE, TASKS_QUEUED_RESPONSE],
+                resource_type_field_name=None,
+            )
+        },
+        description=(
+            "A single `target_language_code` answers with its `task_id`; a list "
+            "of `target_language_codes` answers with one id per distinct code "
+            "in `task_ids`."
+        ),
     )
     @action(detail=True, methods=["post"], url_path="translate")
     def translate(self, request, pk=None):
-        unit = self.get_object()
+        # Validate the body first so malformed requests never hit the database.
         serializer = TranslateRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        target_lang = serializer.validated_data["target_language_code"]
+        unit = self.get_object()
+        validated_data = serializer.validated_data
+        # A single code keeps the original single-task response shape.
+        target_langs = validated_data.get("target_language_codes") or [
+            validated_data["target_language_code"]
+        ]
 
         if not unit.part_of_speech:
             return Response(
                 {"error": "Cannot translate. Please run 'enrich-details' first."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if target_lang.lower() == unit.language.lower():
+        # Targets are canonical already; rows saved before codes were
+        # canonicalized may still hold another spelling.
+        if canonical_language_code(unit.language) in target_langs:
             return Response(
                 {"error": "Target language cannot be the same as the source language."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        return self._queue_task(
+        if "target_language_code" in validated_data:
+            return self._queue_task(
+                translate_unit_async,
+                success_message="Translation task queued.",
+                unit_id=unit.id,
+                user_id=request.user.id,
+                target_language_code=target_langs[0],
+            )
+        return self._queue_tasks(
             translate_unit_async,
-            success_message="Translation task queued.",
-            unit_id=unit.id,
-            user_id=request.user.id,
-            target_language_code=target_lang,
+            [
+                {
+                    "unit_id": unit.id,
+                    "user_id": request.user.id,
+                    "target_language_code": target_lang,
+                }
+                for target_lang in dict.fromkeys(target_langs)
+            ],
+            success_message="Translation tasks queued.",
         )
 
     @extend_schema(
@@ -190,39 +427,38 @@ class LexicalUnitViewSet(TaskQueuingMixin, viewsets.ModelViewSet):
     )
     @action(detail=True, methods=["post"], url_path="generate-phrases")
     def generate_phrases_for_unit(self, request, pk=None):
-        unit = self.get_object()
-        serializer = PhraseGenerationRequestSerializer(data=request.data)
+        # The unit is loaded from validate(), after the fields have passed.
+        serializer = PhraseGenerationRequestSerializer(
+            data=request.data, context={"get_unit": self.get_object}
+        )
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        target_language = validated_data["target_language"]
-        cefr_level = validated_data["cefr"]
-
-        if target_language.lower() == unit.language.lower():
-            return Response(
-                {"error": "Target language cannot be the same as the source language."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
         return self._queue_task(
             generate_phrases_async,
-            unit_id=unit.id,
-            target_language=target_language,
-            cefr_level=cefr_level,
+            unit_id=validated_data["unit"].id,
+            target_language=validated_data["target_language"],
+            cefr_level=validated_data["cefr"],
         )
 
 
-class LexicalUnitTranslationViewSet(viewsets.ModelViewSet):
+class LexicalUnitTranslationViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
-    queryset = LexicalUnitTranslation.objects.select_related(
-        "source_unit", "target_unit"
-    ).all()
     serializer_class = LexicalUnitTranslationSerializer
     filterset_class = LexicalUnitTranslationFilter
     search_fields = ["source_unit__lemma", "target_unit__lemma"]
     ordering_fields = ["id", "confidence"]
     ordering = ["-confidence"]
 
+    def get_queryset(self):
+        # Both units always share an owner (enforced by the serializer), so
+        # scoping on the source unit is enough.
+        return self.setup_eager_loading(
+            LexicalUnitTranslation.objects.filter(
+                source_unit__user_id=self.request.user.id
+            )
+        )
+
     def get_serializer_class(self):
         return (
             LexicalUnitTranslationBulkSerializer
@@ -248,13 +484,24 @@ class LexicalUnitTranslationViewSet(viewsets.ModelViewSet):
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
 
-class PhraseViewSet(TaskQueuingMixin, viewsets.ModelViewSet):
-    queryset = Phrase.objects.all()
+class PhraseViewSet(
+    EagerLoadingViewSetMixin,
+    ReadOnlyListSerializerMixin,
+    TaskQueuingMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = PhraseSerializer
+    list_read_serializer_class = PhraseListSerializer
     filterset_class = PhraseFilter
     search_fields = ["text"]
     ordering_fields = ["id", "language", "category", "cefr"]
-    ordering = ["language", "category", "cefr"]
+    # "id" breaks ties so pages are stable across requests.
+    ordering = ["language", "category", "cefr", "id"]
+
+    def get_queryset(self):
+        # Server-side consumers walking many phrases should use
+        # `.iterator(chunk_size=2000)` on this queryset to bound memory.
+        return self.setup_eager_loading(Phrase.objects.all())
 
     @extend_schema(
         summary="Enrich Phrase Details",
@@ -270,8 +517,7 @@ class PhraseViewSet(TaskQueuingMixin, viewsets.ModelViewSet):
         )
 
 
-class PhraseTranslationViewSet(viewsets.ModelViewSet):
-    queryset = PhraseTranslation.objects.all()
+class PhraseTranslationViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     serializer_class = PhraseTranslationSerializer
     filterset_fields = {
         "source_phrase__language": ["exact"],
@@ -281,6 +527,16 @@ class PhraseTranslationViewSet(viewsets.ModelViewSet):
     }
     search_fields = ["source_phrase__text", "target_phrase__text"]
 
+    def get_queryset(self):
+        # A deterministic pk order keeps pagination stable without an extra sort key.
+        return self.setup_eager_loading(PhraseTranslation.objects.order_by("pk"))
+
+
+TASK_STATUS_CACHE_PREFIX = "task-status:"
+TASK_STATUS_CACHE_TIMEOUT = 60 * 60
+# Results of finished tasks never change; "private" because they are per-user.
+FINISHED_TASK_CACHE_CONTROL = f"private, max-age={TASK_STATUS_CACHE_TIMEOUT}, immutable"
+
 
 class TaskStatusView(APIView):
     permission_classes = [IsAuthenticated]
@@ -299,17 +555,46 @@ class TaskStatusView(APIView):
         },
     )
     def get(self, request, task_id, *args, **kwargs):
-        task_result = AsyncResult(task_id)
-        response_data = {
-            "task_id": task_id,
-            "status": task_result.status,
-            "result": (
-                task_result.result
-                if task_result.successful()
-                else str(task_result.result)
-            ),
-        }
-        return Response(response_data, status=status.HTTP_200_OK)
+        cache_key = f"{TASK_STATUS_CACHE_PREFIX}{task_id}"
+        cached = cache.get(cache_key)
+        if cached is None:
+            # One backend read for both status and result.
+            meta = AsyncResult(task_id).backend.get_task_meta(task_id)
+            task_status = meta["status"]
+            response_data = {
+                "task_id": task_id,
+                "status": task_status,
+                "result": (
+                    meta["result"]
+                    if task_status == states.SUCCESS
+                    else str(meta["result"])
+                ),
+            }
+            if task_status not in states.READY_STATES:
+                response = Response(response_data, status=status.HTTP_200_OK)
+                response["Cache-Control"] = "private, max-age=1"
+                return response
+            # Finished tasks never change again, so stop polling the backend.
+            # The ETag is a digest of that final payload.
+            etag = quote_etag(
+                hashlib.blake2b(
+                    orjson.dumps(response_data, option=orjson.OPT_SORT_KEYS),
+                    digest_size=16,
+                ).hexdigest()
+            )
+            cached = (response_data, etag)
+            cache.set(cache_key, cached, TASK_STATUS_CACHE_TIMEOUT)
+
+        # Only a finished task reaches this point, so a matching ETag means
+        # the client already holds its final result.
+        response_data, etag = cached
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(response_data, status=status.HTTP_200_OK)
+        response["ETag"] = etag
+        response["Cache-Control"] = FINISHED_TASK_CACHE_CONTROL
+        return response
 
 
 class AnalyzeTextView(TaskQueuingMixin, APIView):
@@ -324,13 +609,7 @@ class AnalyzeTextView(TaskQueuingMixin, APIView):
         summary="Analyze Text for New Vocabulary",
         request=AnalyzeTextRequestSerializer,
         responses={
-            202: inline_serializer(
-                name="AnalyzeTextTaskQueuedResponse",
-                fields={
-                    "message": serializers.CharField(),
-                    "task_id": serializers.UUIDField(),
-                },
-            ),
+            202: TASK_QUEUED_RESPONSE,
             400: {"description": "Invalid input."},
             500: {"description": "Failed to queue task."},
         },
@@ -380,4 +659,4 @@ class ExternalImportView(APIView):
         serializer.is_valid(raise_exception=True)
         created_data = serializer.save()
 
-        return Response(created_data, status=status.HTTP_201_CREATED)
\ No newline at end of file
+        return Response(created_data, status=status.HTTP_201_CREATED)
@@ -5,7 +5,9 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple
 
 
@@ -32,6 +34,7 @@ sys.path.insert(0, os.path.join(project_root, 'services'))
 sys.path.insert(0, os.path.join(project_root, '.'))
 
 # --- Import Project Modules ---
+import orjson
 from pydantic import BaseModel, Field, ValidationError
 from ai.client import get_client
 from ai.answer_with_llm import answer_with_llm
@@ -39,6 +42,10 @@ from ai.get_prompt import get_templated_messages
 from learning.enums import CEFR, PhraseCategory
 
 
+# Prompt parameters derived from enums that are fixed at import time.
+_CEFR_LIST = ", ".join(level.value for level in CEFR)
+_CATEGORY_LIST = ", ".join(cat.value for cat in PhraseCategory)
+
 class ASTVisitor(ast.NodeVisitor):
     """
     An AST visitor to find and extract the _SYSTEM_PROMPT variable
@@ -51,15 +58,17 @@ class ASTVisitor(ast.NodeVisitor):
         self.pydantic_class_name: Optional[str] = None
 
     def visit_Assign(self, node: ast.Assign):
-        for target in node.targets:
-            if isinstance(target, ast.Name) and target.id == '_SYSTEM_PROMPT':
-                if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
-                    self.system_prompt = node.value.value
-                    print("✅ Successfully extracted _SYSTEM_PROMPT.")
+        # Match on the target name first; only then inspect the assigned value.
+        is_prompt = any(
+            type(target) is ast.Name and target.id == '_SYSTEM_PROMPT' for target in node.targets
+        )
+        if is_prompt and type(node.value) is ast.Constant and type(node.value.value) is str:
+            self.system_prompt = node.value.value
+            print("✅ Successfully extracted _SYSTEM_PROMPT.")
         self.generic_visit(node)
 
     def visit_ClassDef(self, node: ast.ClassDef):
-        is_pydantic_model = any(isinstance(b, ast.Name) and b.id == 'BaseModel' for b in node.bases)
+        is_pydantic_model = any(type(b) is ast.Name and b.id == 'BaseModel' for b in node.bases)
         if is_pydantic_model:
             self.pydantic_class_source = ast.unparse(node)
             self.pydantic_class_name = node.name
@@ -81,7 +90,14 @@ def extract_from_service_file(file_path: str) -> Tuple[str, str, str]:
 
     tree = ast.parse(source_code)
     visitor = ASTVisitor()
-    visitor.visit(tree)
+    # The prompt and the response model live at module level by convention,
+    # so only top-level statements are visited; function bodies are skipped.
+    for node in tree.body:
+        node_type = type(node)
+        if node_type is ast.Assign:
+            visitor.visit_Assign(node)
+        elif node_type is ast.ClassDef:
+            visitor.visit_ClassDef(node)
 
     if not all([visitor.system_prompt, visitor.pydantic_class_source, visitor.pydantic_class_name]):
         missing = [name for name, var in
@@ -93,9 +109,11 @@ def extract_from_service_file(file_path: str) -> Tuple[str, str, str]:
     return visitor.system_prompt, visitor.pydantic_class_source, visitor.pydantic_class_name
 
 
+@lru_cache(maxsize=32)
 def create_pydantic_model_from_source(class_name: str, source: str) -> type[BaseModel]:
     """
     Dynamically creates a Pydantic model class from its source code.
+    Cached by (class_name, source), so a long-lived driver compiles each model once.
     """
     namespace = {
         'BaseModel': BaseModel, 'Field': Field, 'Optional': Optional,
@@ -124,58 +142,74 @@ def run_gauntlet(
         sys.exit(1)
 
     results = {
-        'by_model': {model: {'success': 0, 'failures': 0, 'latencies': []} for model in models},
+        # Only the mean latency is reported, so keep a running total per model.
+        'by_model': {model: {'success': 0, 'failures': 0, 'latency_total_ms': 0.0} for model in models},
         'successful_outputs': []
     }
 
     total_calls = len(models) * len(phrases)
     current_call = 0
 
-    cefr_list = ", ".join([level.value for level in CEFR])
-    category_list = ", ".join([cat.value for cat in PhraseCategory])
     json_schema = {"guided_json": pydantic_model.model_json_schema()}
 
-    for model_id in models:
-        print(f"\n🚀 Testing Model: {model_id}")
-        for phrase in phrases:
+    # The prompt depends only on the phrase, so render it once per phrase
+    # instead of once per (model, phrase) pair.
+    phrase_messages = [
+        get_templated_messages(
+            system_prompt=system_prompt, user_prompt="",
+            params={
+                "text": phrase['text'], "language": phrase['language'],
+                "cefr_list": _CEFR_LIST, "category_list": _CATEGORY_LIST,
+            },
+        )
+        for phrase in phrases
+    ]
+
+    def _one_call(model_id: str, phrase: Dict[str, str], messages: list):
+        """Runs one (model, phrase) call; returns (status, latency_ms, output)."""
+        start_time = time.perf_counter()
+        output = None
+        try:
+            response_str = answer_with_llm(
+                client=client, messages=messages, model=model_id,
+                extra_body=json_schema, prettify=False, temperature=0.0,
+            )
+            output = pydantic_model.model_validate_json(response_str).model_dump()
+            status = "✅ Success"
+        except (ValidationError, json.JSONDecodeError) as e:
+            status = f"❌ FAILED (Validation: {type(e).__name__})"
+        except Exception as e:
+            status = f"❌ FAILED (API Error: {e})"
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        return status, latency_ms, output
+
+    # Every call is independent and I/O-bound, so fan them out over threads.
+    # Results are only touched here, on the main thread, so no lock is needed.
+    print(f"\n🚀 Testing {len(models)} model(s) on {len(phrases)} phrase(s)")
+    with ThreadPoolExecutor(max_workers=max(1, min(16, total_calls))) as executor:
+        futures = {
+            executor.submit(_one_call, model_id, phrase, messages): (model_id, phrase)
+            for model_id in models
+            for phrase, messages in zip(phrases, phrase_messages)
+        }
+        for future in as_completed(futures):
+            model_id, phrase = futures[future]
+            status, latency_ms, output = future.result()
             current_call += 1
-            print(f"  [{current_call}/{total_calls}] Phrase: '{phrase['text']}'...", end=' ', flush=True)
-
-            start_time = time.perf_counter()
-
-            try:
-                params = {
-                    "text": phrase['text'], "language": phrase['language'],
-                    "cefr_list": cefr_list, "category_list": category_list,
-                }
-                messages = get_templated_messages(system_prompt=system_prompt, user_prompt="", params=params)
-
-                response_str = answer_with_llm(
-                    client=client, messages=messages, model=model_id,
-                    extra_body=json_schema, temperature=0.0,
-                )
-
-                validated_output = pydantic_model.model_validate_json(response_str)
-
-                results['by_model'][model_id]['success'] += 1
-                results['successful_outputs'].append({
-                    "model_id": model_id,
-                    "phrase": phrase,
-                    "output": validated_output.model_dump(),
-                    "score": None  # Placeholder for manual scoring
-                })
-                print("✅ Success")
-
-            except (ValidationError, json.JSONDecodeError) as e:
-                results['by_model'][model_id]['failures'] += 1
-                print(f"❌ FAILED (Validation: {type(e).__name__})")
-            except Exception as e:
-                results['by_model'][model_id]['failures'] += 1
-                print(f"❌ FAILED (API Error: {e})")
-
-            end_time = time.perf_counter()
-            latency_ms = (end_time - start_time) * 1000
-            results['by_model'][model_id]['latencies'].append(latency_ms)
+            print(f"  [{current_call}/{total_calls}] {model_id} | Phrase: '{phrase['text']}'... {status}")
+
+            model_results = results['by_model'][model_id]
+            model_results['latency_total_ms'] += latency_ms
+            if output is None:
+                model_results['failures'] += 1
+                continue
+            model_results['success'] += 1
+            results['successful_outputs'].append({
+                "model_id": model_id,
+                "phrase": phrase,
+                "output": output,
+                "score": None  # Placeholder for manual scoring
+            })
 
     return results
 
@@ -186,9 +220,9 @@ def save_results_for_review(successful_outputs: List[Dict], filename="gauntlet_r
         print("\nNo successful outputs to save.")
         return
 
-    with open(filename, 'w', encoding='utf-8') as f:
-        for item in successful_outputs:
-            f.write(json.dumps(item) + '\n')
+    # orjson emits UTF-8 bytes directly; one large buffer keeps writes coarse.
+    with open(filename, 'wb', buffering=1 << 20) as f:
+        f.writelines(orjson.dumps(item) + b'\n' for item in successful_outputs)
     print(f"\n✅ All successful outputs saved to '{filename}'.")
     print("   Next step: Manually edit this file to add a numeric 'score' to each entry.")
 
@@ -199,7 +233,7 @@ def print_summary(results: Dict):
     for model, data in results['by_model'].items():
         total = data['success'] + data['failures']
         success_rate = (data['success'] / total) * 100 if total > 0 else 0
-        avg_latency = sum(data['latencies']) / len(data['latencies']) if data['latencies'] else 0
+        avg_latency = data['latency_total_ms'] / total if total > 0 else 0
         summary_data.append({
             'Model': model,
             'Success Rate (%)': success_rate,
@@ -214,19 +248,21 @@ def print_summary(results: Dict):
         print("No results to display.")
         return
 
-    headers = summary_data[0].keys()
-    col_widths = {h: max(len(h), max(
-        (len(f"{row[h]:.2f}") if isinstance(row[h], float) else len(str(row[h]))) for row in summary_data)) for h in
-                  headers}
-    header_line = " | ".join(h.ljust(col_widths[h]) for h in headers)
+    headers = list(summary_data[0].keys())
+    # Format every cell once; the widths and the printed rows both reuse it.
+    stringified = [
+        [f"{row[h]:.2f}" if isinstance(row[h], float) else str(row[h]) for h in headers]
+        for row in summary_data
+    ]
+    col_widths = [
+        max(len(h), max(len(cells[i]) for cells in stringified)) for i, h in enumerate(headers)
+    ]
+    header_line = " | ".join(h.ljust(width) for h, width in zip(headers, col_widths))
     print(header_line)
     print("-" * len(header_line))
 
-    for row in summary_data:
-        row_items = [
-            f"{row[h]:.2f}".ljust(col_widths[h]) if isinstance(row[h], float) else str(row[h]).ljust(col_widths[h]) for
-            h in headers]
-        print(" | ".join(row_items))
+    for cells in stringified:
+        print(" | ".join(cell.ljust(width) for cell, width in zip(cells, col_widths)))
     print("\n" + "=" * len(header_line))
 
 
@@ -1,11 +1,25 @@
 # In new file: services/enrich_phrase_details.py
 
 import logging
-from typing import Optional
-
-from pydantic import BaseModel, Field
-
-from ai.answer_with_llm import answer_with_llm
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+from ai.answer_with_llm import (
+    answer_with_llm,
+    answer_with_llm_async,
+    is_complete_json,
+)
+from ai.cache import (
+    LLM_CACHE_TIMEOUT,
+    aget_cached,
+    get_many_cached,
+    llm_cache,
+    llm_cache_key,
+    prompt_version,
+)
 from ai.get_prompt import get_templated_messages
 from learning.enums import CEFR, PhraseCategory
 from learning.models import Phrase
@@ -14,6 +28,10 @@ logger = logging.getLogger(__name__)
 
 MODEL = "deepseek-ai/DeepSeek-V3-0324"
 
+# Upper bound on LLM requests in flight for one batch; stays well inside the
+# shared client's connection pool (see ai.client.get_client).
+MAX_CONCURRENCY = 16
+
 
 # 1. Pydantic-модель для валидации ответа от LLM
 class PhraseAnalysisResponse(BaseModel):
@@ -33,6 +51,12 @@ class PhraseAnalysisResponse(BaseModel):
     )
 
 
+# Invariant for the process lifetime, so built once at import.
+_PHRASE_SCHEMA = PhraseAnalysisResponse.model_json_schema()
+_CEFR_LIST = ", ".join(level.value for level in CEFR)
+_CATEGORY_LIST = ", ".join(cat.value for cat in PhraseCategory)
+
+
 # 2. Финальная версия промпта
 _SYSTEM_PROMPT = """
 You are an expert linguistic analyst and language tutor. Your task is to meticulously analyze the phrase "{text}" which was submitted as being in the language "{language}".
@@ -50,49 +74,138 @@ You must perform the following analysis and return ONLY a valid JSON object that
 5.  **category**: Classify the phrase. It MUST be one of: {category_list}.
 """
 
+# The enum lists never change, so they are substituted once here; only
+# {text} and {language} are left for the per-call template render.
+_PREPARED_SYSTEM_PROMPT = _SYSTEM_PROMPT.replace("{cefr_list}", _CEFR_LIST).replace(
+    "{category_list}", _CATEGORY_LIST
+)
+
+
+_LLM_OPTIONS = {
+    "model": MODEL,
+    "extra_body": {"guided_json": _PHRASE_SCHEMA},
+    "prettify": False,
+    "temperature": 0.1,
+}
+
+_PROMPT_VERSION = prompt_version(_PREPARED_SYSTEM_PROMPT, _PHRASE_SCHEMA)
+
+
+def _cache_key(phrase: Phrase) -> str:
+    return llm_cache_key("phrase", _PROMPT_VERSION, MODEL, phrase.language, phrase.text)
+
+
+def _phrase_messages(phrase: Phrase) -> list:
+    params = {"text": phrase.text, "language": phrase.language}
+    return get_templated_messages(
+        system_prompt=_PREPARED_SYSTEM_PROMPT, user_prompt="", params=params
+    )
+
 
 # 3. Основная сервисная функция
 def enrich_phrase_details(client, phrase: Phrase) -> Optional[PhraseAnalysisResponse]:
+    return enrich_phrase_details_batch(client, [phrase])[0]
+
+
+def enrich_phrase_details_batch(
+    client, phrases: Iterable[Phrase], max_concurrency: int = MAX_CONCURRENCY
+) -> List[Optional[PhraseAnalysisResponse]]:
+    """
+    Analyzes many phrases with concurrent LLM requests. The work is bound by
+    network latency, so threads overlap the waits. Results are aligned with
+    the input order; a failed phrase yields None, as in the single call.
+    """
+    phrases = list(phrases)
+    # The same (text, language) always gets the same analysis, so only
+    # phrases missing from the cache go to the LLM.
+    keys = [_cache_key(p) for p in phrases]
+    results = get_many_cached(keys, PhraseAnalysisResponse.model_validate)
+    misses = [(key, phrase) for key, phrase in zip(keys, phrases) if key not in results]
+
+    if len(misses) == 1:
+        fresh = [_analyze_phrase(client, misses[0][1])]
+    elif misses:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(misses))) as pool:
+            fresh = list(
+                pool.map(lambda miss: _analyze_phrase(client, miss[1]), misses)
+            )
+    else:
+        fresh = []
+
+    analyzed = {
+        key: analysis
+        for (key, _), analysis in zip(misses, fresh)
+        if analysis is not None
+    }
+    llm_cache.set_many(
+        {key: analysis.model_dump(mode="json") for key, analysis in analyzed.items()},
+        LLM_CACHE_TIMEOUT,
+    )
+    results.update(analyzed)
+    return [results.get(key) for key in keys]
+
+
+def _analyze_phrase(client, phrase: Phrase) -> Optional[PhraseAnalysisResponse]:
     logger.debug(
-        f"Starting enrich_phrase_details for phrase '{phrase.text}' (ID: {phrase.id})"
-    )  # <-- ДОБАВИТЬ
+        "Calling answer_with_llm for phrase '%s' (ID: %s) with model '%s'",
+        phrase.text,
+        phrase.id,
+        MODEL,
+    )
     try:
-        cefr_list = ", ".join([level.value for level in CEFR])
-        category_list = ", ".join([cat.value for cat in PhraseCategory])
-
-        params = {
-            "text": phrase.text,
-            "language": phrase.language,
-            "cefr_list": cefr_list,
-            "category_list": category_list,
-        }
-
-        messages = get_templated_messages(
-            system_prompt=_SYSTEM_PROMPT, user_prompt="", params=params
-        )
-
-        logger.debug(
-            f"Calling answer_with_llm for phrase '{phrase.text}' with model 'meta-llama/Llama-3.3-70B-Instruct'"
-        )  # <-- ДОБАВИТЬ
         response_str = answer_with_llm(
-            client=client,
-            messages=messages,
-            # model="meta-llama/Llama-3.3-70B-Instruct",
-            # model="google/gemma-2-9b-it-fast",
-            # model="mistralai/Mistral-Nemo-Instruct-2407",
-            model=MODEL,
-            extra_body={"guided_json": PhraseAnalysisResponse.model_json_schema()},
-            temperature=0.1,
+            client=client, messages=_phrase_messages(phrase), **_LLM_OPTIONS
         )
-        logger.debug(
-            f"answer_with_llm returned for phrase '{phrase.text}'. Attempting to validate JSON."
-        )  # <-- ДОБАВИТЬ
+    except Exception as e:
+        _log_failure(phrase, e)
+        return None
+    return _parse_analysis(phrase, response_str)
+
 
+def _parse_analysis(
+    phrase: Phrase, response_str: str
+) -> Optional[PhraseAnalysisResponse]:
+    """Validates a reply; shared by the sync and async paths."""
+    if not is_complete_json(response_str):
+        logger.warning("Truncated LLM response for phrase '%s'.", phrase.text)
+        return None
+    try:
         return PhraseAnalysisResponse.model_validate_json(response_str)
+    except ValidationError as e:
+        _log_failure(phrase, e)
+        return None
 
-    except Exception as e:
-        logger.error(
-            f"LLM call or parsing failed during enrichment of phrase '{phrase.text}': {e}",
-            exc_info=True,
+
+def _log_failure(phrase: Phrase, exc: Exception) -> None:
+    # LLM failures are routine; only pay for the traceback at DEBUG.
+    logger.error(
+        "LLM call or parsing failed during enrichment of phrase '%s': %s",
+        phrase.text,
+        exc,
+        exc_info=logger.isEnabledFor(logging.DEBUG),
+    )
+
+
+async def enrich_phrase_details_async(
+    client, phrase: Phrase
+) -> Optional[PhraseAnalysisResponse]:
+    """
+    enrich_phrase_details for an AsyncOpenAI client (see
+    ai.client.get_async_client). Gather many of these on one loop to keep
+    their requests in flight together; the cache is shared with the sync path.
+    """
+    key = _cache_key(phrase)
+    analysis = await aget_cached(key, PhraseAnalysisResponse.model_validate)
+    if analysis is not None:
+        return analysis
+    try:
+        response_str = await answer_with_llm_async(
+            client=client, messages=_phrase_messages(phrase), **_LLM_OPTIONS
         )
+    except Exception as e:
+        _log_failure(phrase, e)
         return None
+    analysis = _parse_analysis(phrase, response_str)
+    if analysis is not None:
+        await llm_cache.aset(key, analysis.model_dump(mode="json"), LLM_CACHE_TIMEOUT)
+    return analysis
@@ -1,8 +1,9 @@
 import logging
-from typing import List, Optional
+import os
+from functools import lru_cache
+from multiprocessing import current_process
+from typing import List, Optional, Union
 from abc import ABC, abstractmethod
-import spacy
-from langcodes import Language
 from pydantic import BaseModel, Field
 
 from ai.answer_with_llm import answer_with_llm
@@ -31,19 +32,49 @@ SPACY_MODELS = {
     # Add other languages as you support them
 }
 
-# Load SpaCy models globally to avoid reloading on each call
-_SPACY_PIPELINES = {}
-for lang_code, model_name in SPACY_MODELS.items():
+# Lemmatization only needs the tagger/morphologizer, attribute_ruler and the
+# lemmatizer; the rule-based lemmatizers read the POS that attribute_ruler
+# sets, so it has to stay. Everything below is skipped at load time.
+SPACY_EXCLUDED_COMPONENTS = ["ner", "parser", "senter", "textcat"]
+
+
+@lru_cache(maxsize=None)
+def _get_spacy_pipeline(lang_code: str):
+    """
+    Loads the SpaCy pipeline for a primary language code on first use and
+    caches it for the process. Returns None if no model is available.
+    """
+    model_name = SPACY_MODELS.get(lang_code)
+    if model_name is None:
+        return None
+
+    # Imported here so web workers, which import this module only through
+    # learning.tasks, never pay for spaCy or its models.
+    import spacy
+
     try:
-        _SPACY_PIPELINES[lang_code] = spacy.load(model_name)
-        logger.info(f"SpaCy model '{model_name}' loaded for language '{lang_code}'.")
+        nlp = spacy.load(model_name, exclude=SPACY_EXCLUDED_COMPONENTS)
     except OSError:
         logger.warning(
-            f"SpaCy model '{model_name}' for language '{lang_code}' not found. "
-            "Ensure it's downloaded (e.g., `python -m spacy download {model_name}`). "
-            "LLM will be used as fallback for this language."
+            "SpaCy model '%s' for language '%s' not found. "
+            "Ensure it's downloaded (e.g., `python -m spacy download %s`). "
+            "LLM will be used as fallback for this language.",
+            model_name,
+            lang_code,
+            model_name,
         )
-        _SPACY_PIPELINES[lang_code] = None  # Mark as not available
+        return None
+    logger.info("SpaCy model '%s' loaded for language '%s'.", model_name, lang_code)
+    return nlp
+
+
+@lru_cache(maxsize=128)
+def _primary_lang(code: str) -> str:
+    """Returns the primary language subtag of a BCP47 code ('en-GB' -> 'en')."""
+    # Codes are validated as BCP47 on input, so the primary subtag is simply
+    # everything before the first hyphen.
+    return code.split("-", 1)[0].lower()
+
 
 # LLM for text analysis - choose a capable model
 LLM_MODEL = "deepseek-ai/DeepSeek-V3-0324"
@@ -56,6 +87,9 @@ class ExtractedLemmasResponse(BaseModel):
     )
 
 
+_LEMMAS_SCHEMA = ExtractedLemmasResponse.model_json_schema()
+
+
 # --- LLM Prompts ---
 _SYSTEM_PROMPT_LEMMA_EXTRACTION_LLM = """
 You are an expert linguistic analyst. Your task is to process the given text and extract all unique lexical lemmas.
@@ -87,42 +121,82 @@ class BaseLemmaExtractor(ABC):
 
 # --- Concrete SpaCy Lemma Extractor ---
 class SpaCyLemmaExtractor(BaseLemmaExtractor):
+    # Texts handed to nlp.pipe per internal batch.
+    batch_size = 64
+    # Below this many texts, starting worker processes costs more than it saves.
+    multiprocess_min_texts = 128
+    texts_per_process = 32
+
     def extract(
         self, text: str, source_language: Optional[str] = None
     ) -> Optional[List[str]]:  # Renamed language_hint to source_language
+        results = self.extract_many([text], source_language)
+        return None if results is None else results[0]
+
+    def extract_many(
+        self, texts: List[str], source_language: Optional[str] = None
+    ) -> Optional[List[List[str]]]:
+        """
+        Extracts lemmas from several texts in one nlp.pipe pass, so SpaCy can
+        batch the work. Returns one sorted lemma list per text, in input order.
+        """
         if not source_language:
             logger.warning("SpaCy extractor requires a source language.")
             return None
 
         # Normalize source_language to primary language code (e.g., 'en-GB' -> 'en')
-        primary_lang = Language.get(source_language).language
-        nlp = _SPACY_PIPELINES.get(primary_lang)
+        primary_lang = _primary_lang(source_language)
+        nlp = _get_spacy_pipeline(primary_lang)
 
         if not nlp:
             logger.warning(
-                f"No SpaCy model loaded for language '{primary_lang}'. Cannot use SpaCy for lemma extraction."
+                "No SpaCy model loaded for language '%s'. Cannot use SpaCy for lemma extraction.",
+                primary_lang,
             )
             return None
 
         try:
-            doc = nlp(text)
-            lemmas = set()
-            for token in doc:
-                # Basic filtering: remove punctuation, spaces, numbers, and short tokens
-                if (
-                    token.is_alpha
-                    and not token.is_stop
-                    and len(token.lemma_.strip()) > 1
-                ):
-                    lemmas.add(token.lemma_.lower())  # Convert to lower for consistency
-            return sorted(list(lemmas))
+            return [
+                self._doc_lemmas(doc)
+                for doc in nlp.pipe(
+                    texts,
+                    batch_size=self.batch_size,
+                    n_process=self._n_process(len(texts)),
+                )
+            ]
         except Exception as e:
             logger.error(
-                f"SpaCy lemma extraction failed for source language '{source_language}': {e}",
+                "SpaCy lemma extraction failed for source language '%s': %s",
+                source_language,
+                e,
                 exc_info=True,
             )  # Updated log message
             return None
 
+    def _n_process(self, n_texts: int) -> int:
+        # Celery prefork children are daemonic and may not start processes.
+        if n_texts < self.multiprocess_min_texts or current_process().daemon:
+            return 1
+        return max(1, min(os.cpu_count() or 1, n_texts // self.texts_per_process))
+
+    @staticmethod
+    def _doc_lemmas(doc) -> List[str]:
+        # Already loaded along with the pipeline; see _get_spacy_pipeline.
+        import numpy
+        from spacy.attrs import IS_ALPHA, IS_STOP, LEMMA
+
+        # One to_array() pass instead of three attribute lookups per token.
+        attrs = doc.to_array([LEMMA, IS_ALPHA, IS_STOP]).reshape(-1, 3)
+        # Basic filtering: remove punctuation, spaces, numbers, and stop words
+        mask = (attrs[:, 1] == 1) & (attrs[:, 2] == 0)
+        strings = doc.vocab.strings
+        lemmas = {
+            strings[lemma_id].lower()  # Convert to lower for consistency
+            for lemma_id in numpy.unique(attrs[mask, 0]).tolist()
+        }
+        # ...and short tokens
+        return sorted(lemma for lemma in lemmas if len(lemma.strip()) > 1)
+
 
 # --- Concrete LLM Lemma Extractor ---
 class LLMLemmaExtractor(BaseLemmaExtractor):
@@ -142,7 +216,7 @@ class LLMLemmaExtractor(BaseLemmaExtractor):
                 client=self.client,
                 messages=messages,
                 model=LLM_MODEL,
-                extra_body={"guided_json": ExtractedLemmasResponse.model_json_schema()},
+                extra_body={"guided_json": _LEMMAS_SCHEMA},
                 prettify=False,
                 temperature=0.0,
             )
@@ -151,37 +225,48 @@ class LLMLemmaExtractor(BaseLemmaExtractor):
             )
             return validated_response.lemmas
         except Exception as e:
-            logger.error(f"LLM lemma extraction failed: {e}", exc_info=True)
+            # LLM failures are routine; only pay for the traceback at DEBUG.
+            logger.error(
+                "LLM lemma extraction failed: %s",
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             return None
 
 
 # --- Main function for selecting and running extractor ---
 def extract_lemmas_from_text(
-    client, text: str, source_language: Optional[str] = None
-) -> Optional[List[str]]:  # Renamed language_hint to source_language
+    client, text: Union[str, List[str]], source_language: Optional[str] = None
+) -> Optional[Union[List[str], List[Optional[List[str]]]]]:
     """
     Selects and uses the appropriate lemma extractor (SpaCy or LLM) based on language support.
 
     Args:
         client: An OpenAI-compatible client (required for LLM fallback).
-        text: The text block to analyze.
+        text: The text block to analyze, or a list of text blocks.
         source_language: An optional BCP47 language code to prioritize SpaCy model usage.
 
     Returns:
-        A list of unique lemma strings, or None if extraction fails.
+        A list of unique lemma strings, or None if extraction fails. Given a
+        list of texts, one such result per text.
     """
+    if isinstance(text, list):
+        return _extract_lemmas_from_texts(client, text, source_language)
+
     # Attempt to use SpaCy if a source_language is provided and model is loaded
     if source_language:
         spacy_extractor = SpaCyLemmaExtractor()
         lemmas = spacy_extractor.extract(text, source_language)
         if lemmas is not None:  # If SpaCy succeeded (even if it found no lemmas)
             logger.info(
-                f"Successfully extracted lemmas using SpaCy for source language '{source_language}'."
+                "Successfully extracted lemmas using SpaCy for source language '%s'.",
+                source_language,
             )  # Updated log message
             return lemmas
         else:
             logger.warning(
-                f"SpaCy failed or not available for source language '{source_language}'. Falling back to LLM."
+                "SpaCy failed or not available for source language '%s'. Falling back to LLM.",
+                source_language,
             )  # Updated log message
 
     # Fallback to LLM extractor
@@ -194,3 +279,14 @@ def extract_lemmas_from_text(
     else:
         logger.error("Both SpaCy and LLM lemma extraction failed.")
         return None
+
+
+def _extract_lemmas_from_texts(
+    client, texts: List[str], source_language: Optional[str]
+) -> List[Optional[List[str]]]:
+    if source_language:
+        results = SpaCyLemmaExtractor().extract_many(texts, source_language)
+        if results is not None:
+            return results
+    # The LLM has no batch endpoint; fall back to one request per text.
+    return [extract_lemmas_from_text(client, text) for text in texts]
@@ -8,16 +8,32 @@ for a lexical unit, using guided-JSON that matches the Pydantic schema
 from __future__ import annotations
 
 import logging
-from typing import List
+from collections import defaultdict
+from typing import Iterable, List
+
+import orjson
 
 # from openai import OpenAI  # type: ignore
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
-from ai.answer_with_llm import answer_with_llm
-from ai.client import get_client
+from ai.answer_with_llm import (
+    answer_with_llm,
+    answer_with_llm_async,
+    is_complete_json,
+)
+from ai.cache import (
+    LLM_CACHE_TIMEOUT,
+    aget_cached,
+    get_cached,
+    get_many_cached,
+    llm_cache,
+    llm_cache_key,
+    prompt_version,
+)
 from ai.get_prompt import get_templated_messages
 from learning.enums import PartOfSpeech, LexicalCategory
 from learning.models import LexicalUnit
+from learning.utils import get_canonical_lemma
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +56,26 @@ class CharacterProfileResponse(BaseModel):
     lemma_details: List[CharacterProfile]
 
 
+class BatchLemmaDetails(BaseModel):
+    """One unit's entry in a batched response."""
+
+    lemma: str
+    lemma_details: List[CharacterProfile]
+
+
+class BatchLemmaDetailsResponse(BaseModel):
+    """Top-level wrapper for a batched request."""
+
+    results: List[BatchLemmaDetails]
+
+
+# Invariant for the process lifetime, so built once at import.
+_LEMMA_SCHEMA = CharacterProfileResponse.model_json_schema()
+_BATCH_SCHEMA = BatchLemmaDetailsResponse.model_json_schema()
+_POS_LIST = ", ".join(choice[0] for choice in PartOfSpeech.choices if choice[0])
+_LEXCAT_LIST = ", ".join(choice[0] for choice in LexicalCategory.choices if choice[0])
+
+
 _PROMPT_TEMPLATE = """
 You are an expert linguistic analyst. Your task is to analyze the lexical unit "{lemma}" in the language "{language}".
 
@@ -57,63 +93,249 @@ You are an expert linguistic analyst. Your task is to analyze the lexical unit "
 Respond with nothing except valid JSON that conforms to the schema.
 """.strip()
 
+# The enum lists never change, so they are substituted once here; only
+# {lemma} and {language} are left for the per-call template render.
+_PREPARED_PROMPT_TEMPLATE = _PROMPT_TEMPLATE.replace(
+    "{lexical_category_enum_list}", _LEXCAT_LIST
+).replace("{pos_enum_values_list}", _POS_LIST)
+
 _USER_PROMPT = 'The lexical unit is: "{lemma}"\nIts language code is: "{language}"'
 
+_BATCH_PROMPT_TEMPLATE = f"""
+You are an expert linguistic analyst. Your task is to analyze each lexical unit in the JSON list you are given; all of them are in the language "{{language}}".
 
-# ──────────────────────────── Service ─────────────────────────────────
-# client = get_client()
+Return one entry in "results" per lexical unit, in the given order. Its "lemma" MUST repeat the lexical unit exactly as given, and its "lemma_details" MUST be filled in as follows.
 
+**Analysis Steps:**
+1.  **Recognition:** First, determine if the lexical unit is a recognized word, multi-word unit, idiom, or phrasal verb in the language "{{language}}". If not, its "lemma_details" MUST be an empty list.
+2.  **Categorization:** For each recognized form, determine its structural type (`lexical_category`) and its primary grammatical function (`part_of_speech`).
 
-def get_lemma_details(client, lexical_unit: LexicalUnit) -> list[dict]:
-    """Return all POS variants and IPA pronunciations for *lexical_unit*.
+**CRITICAL RULES:**
+-   `lexical_category` MUST be one of: {_LEXCAT_LIST}.
+-   `part_of_speech` MUST be one of: {_POS_LIST}.
+-   For multi-word units (e.g., phrasal verbs, idioms), the `part_of_speech` must reflect the function of the ENTIRE phrase (e.g., "take off" is a 'verb').
+-   If the lexical unit is a proper noun or its type/POS is outside the provided lists, its "lemma_details" MUST be an empty list.
+-   If pronunciation cannot be found, set its value to null.
 
-    Args:
-        client: OpenAI-compatible client instance.
-        lexical_unit: The lexical unit to enrich.
+Respond with nothing except valid JSON that conforms to the schema.
+""".strip()
 
-    Returns:
-        A list like:
-        `[{"part_of_speech": "noun", "pronunciation": "/tʃæt/"}, …]`.
-        An empty list is returned on any error or when nothing is found.
-    """
+_BATCH_USER_PROMPT = (
+    'The lexical units are: {lemmas}\nTheir language code is: "{language}"'
+)
+
+# Units per batched request, and the completion budget each one gets.
+LEMMA_BATCH_SIZE = 25
+_BATCH_TOKENS_PER_UNIT = 128
+
+
+_LLM_OPTIONS = {
+    "model": LLM_MODEL,
+    "prettify": False,
+    "temperature": 0.0,
+    "extra_body": {"guided_json": _LEMMA_SCHEMA},
+}
+
+# The batch prompt fills the same cache entries, so it is versioned too.
+_PROMPT_VERSION = prompt_version(
+    _PREPARED_PROMPT_TEMPLATE,
+    _USER_PROMPT,
+    _LEMMA_SCHEMA,
+    _BATCH_PROMPT_TEMPLATE,
+    _BATCH_USER_PROMPT,
+    _BATCH_SCHEMA,
+)
+
+
+# ──────────────────────────── Helpers ─────────────────────────────────
+
+
+def _cache_key(lexical_unit: LexicalUnit) -> str:
+    return llm_cache_key(
+        "lemma_details",
+        _PROMPT_VERSION,
+        LLM_MODEL,
+        lexical_unit.language,
+        lexical_unit.lemma,
+    )
+
+
+def _validate_details(value) -> list[dict]:
+    """Re-validates cached details as _parse_details would have returned them."""
+    validated = CharacterProfileResponse.model_validate({"lemma_details": value})
+    return validated.model_dump(mode="json")["lemma_details"]
+
+
+def _lemma_messages(lexical_unit: LexicalUnit) -> list:
+    params = {"lemma": lexical_unit.lemma, "language": lexical_unit.language}
+    return get_templated_messages(
+        system_prompt=_PREPARED_PROMPT_TEMPLATE,
+        user_prompt=_USER_PROMPT,
+        params=params,
+    )
+
+
+def _parse_details(lexical_unit: LexicalUnit, response_str: str) -> list[dict]:
+    """Validates a reply; shared by the sync and async paths."""
+    if not is_complete_json(response_str):
+        logger.warning("Truncated LLM response for %s.", lexical_unit.lemma)
+        return []
     try:
-        # Получаем список частей речи
-        pos_choices_str = ", ".join(
-            choice[0] for choice in PartOfSpeech.choices if choice[0]
-        )
-        # +++ Получаем список лексических категорий
-        lexical_category_choices_str = ", ".join(
-            choice[0] for choice in LexicalCategory.choices if choice[0]
+        validated = CharacterProfileResponse.model_validate_json(response_str)
+    except ValidationError as exc:
+        _log_failure(lexical_unit, exc)
+        return []
+    logger.debug("Validated LLM response: %s", validated)
+
+    # One model_dump() serializes the whole list in pydantic-core.
+    return validated.model_dump(mode="json")["lemma_details"]
+
+
+def _log_failure(lexical_unit: LexicalUnit, exc: Exception) -> None:
+    # LLM failures are routine; only pay for the traceback at DEBUG.
+    logger.error(
+        "Fetching details for %s failed: %s",
+        lexical_unit.lemma,
+        exc,
+        exc_info=logger.isEnabledFor(logging.DEBUG),
+    )
+
+
+def _fetch_lemma_details(client, lexical_unit: LexicalUnit) -> list[dict]:
+    try:
+        response_str = answer_with_llm(
+            messages=_lemma_messages(lexical_unit), client=client, **_LLM_OPTIONS
         )
-        params = {
-            "lemma": lexical_unit.lemma,
-            "language": lexical_unit.language,
-            "pos_enum_values_list": pos_choices_str,
-            "lexical_category_enum_list": lexical_category_choices_str,  # <-- Передаем в промпт
-        }
-        messages = get_templated_messages(
-            system_prompt=_PROMPT_TEMPLATE, user_prompt=_USER_PROMPT, params=params
+    except Exception as exc:  # noqa: BLE001  (logged & swallowed)
+        _log_failure(lexical_unit, exc)
+        return []
+    return _parse_details(lexical_unit, response_str)
+
+
+async def _fetch_lemma_details_async(client, lexical_unit: LexicalUnit) -> list[dict]:
+    try:
+        response_str = await answer_with_llm_async(
+            messages=_lemma_messages(lexical_unit), client=client, **_LLM_OPTIONS
         )
+    except Exception as exc:  # noqa: BLE001  (logged & swallowed)
+        _log_failure(lexical_unit, exc)
+        return []
+    return _parse_details(lexical_unit, response_str)
+
 
+def _fetch_batch(client, language: str, lemmas: list[str]) -> dict[str, list[dict]]:
+    params = {
+        "language": language,
+        "lemmas": orjson.dumps(lemmas).decode(),
+    }
+    try:
         response_str = answer_with_llm(
-            messages=messages,
+            messages=get_templated_messages(
+                system_prompt=_BATCH_PROMPT_TEMPLATE,
+                user_prompt=_BATCH_USER_PROMPT,
+                params=params,
+            ),
             client=client,
             model=LLM_MODEL,
+            max_tokens=_BATCH_TOKENS_PER_UNIT * len(lemmas),
             prettify=False,
             temperature=0.0,
-            extra_body={"guided_json": CharacterProfileResponse.model_json_schema()},
+            extra_body={"guided_json": _BATCH_SCHEMA},
         )
-
-        validated = CharacterProfileResponse.model_validate_json(response_str)
-        logger.debug("Validated LLM response: %s", validated)
-
-        return [profile.model_dump() for profile in validated.lemma_details]
-
+        if not is_complete_json(response_str):
+            logger.warning(
+                "Truncated LLM response for %d %s lemmas.", len(lemmas), language
+            )
+            return {}
+        validated = BatchLemmaDetailsResponse.model_validate_json(response_str)
     except Exception as exc:  # noqa: BLE001  (logged & swallowed)
         logger.error(
-            "Fetching details for %s failed: %s",
-            lexical_unit.lemma,
+            "Fetching details for %d %s lemmas failed: %s",
+            len(lemmas),
+            language,
             exc,
-            exc_info=True,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
         )
-        return []
+        return {}
+    # One model_dump() serializes the whole tree in pydantic-core.
+    return {
+        get_canonical_lemma(entry["lemma"]): entry["lemma_details"]
+        for entry in validated.model_dump(mode="json")["results"]
+    }
+
+
+# ──────────────────────────── Service ─────────────────────────────────
+
+
+def get_lemma_details(
+    client, lexical_unit: LexicalUnit, force_update: bool = False
+) -> list[dict]:
+    """Return all POS variants and IPA pronunciations for *lexical_unit*.
+
+    Args:
+        client: OpenAI-compatible client instance.
+        lexical_unit: The lexical unit to enrich.
+        force_update: Ask the LLM even if a cached answer exists; the fresh
+            answer still replaces the cached one.
+
+    Returns:
+        A list like:
+        `[{"part_of_speech": "noun", "pronunciation": "/tʃæt/"}, …]`.
+        An empty list is returned on any error or when nothing is found.
+    """
+    # Empty results are not cached: they may come from a transient failure.
+    key = _cache_key(lexical_unit)
+    details = None if force_update else get_cached(key, _validate_details)
+    if details is None:
+        details = _fetch_lemma_details(client, lexical_unit)
+        if details:
+            llm_cache.set(key, details, LLM_CACHE_TIMEOUT)
+    return details
+
+
+async def get_lemma_details_async(client, lexical_unit: LexicalUnit) -> list[dict]:
+    """Same as get_lemma_details, for an AsyncOpenAI client.
+
+    Gather many of these on one event loop (see ai.client.get_async_client)
+    to keep their requests in flight together.
+    """
+    key = _cache_key(lexical_unit)
+    details = await aget_cached(key, _validate_details)
+    if details is None:
+        details = await _fetch_lemma_details_async(client, lexical_unit)
+        if details:
+            await llm_cache.aset(key, details, LLM_CACHE_TIMEOUT)
+    return details
+
+
+def get_lemma_details_batch(
+    client, lexical_units: Iterable[LexicalUnit]
+) -> list[list[dict]]:
+    """Return get_lemma_details for many units with few LLM requests.
+
+    Units missing from the cache are grouped by language and sent up to
+    LEMMA_BATCH_SIZE per request, so the shared prompt is paid once per
+    group instead of once per unit. Results are aligned with the input;
+    a unit the LLM skipped or failed on gets an empty list.
+    """
+    units = list(lexical_units)
+    keys = [_cache_key(unit) for unit in units]
+    results = get_many_cached(keys, _validate_details)
+
+    # language -> canonical lemma -> cache keys of the units asking for it
+    by_language = defaultdict(lambda: defaultdict(set))
+    for key, unit in zip(keys, units):
+        if key not in results:
+            by_language[unit.language][get_canonical_lemma(unit.lemma)].add(key)
+    fetched = {}
+    for language, keys_by_lemma in by_language.items():
+        lemmas = list(keys_by_lemma)
+        for start in range(0, len(lemmas), LEMMA_BATCH_SIZE):
+            chunk = lemmas[start : start + LEMMA_BATCH_SIZE]
+            for lemma, details in _fetch_batch(client, language, chunk).items():
+                if details:
+                    fetched.update(dict.fromkeys(keys_by_lemma.get(lemma, ()), details))
+
+    llm_cache.set_many(fetched, LLM_CACHE_TIMEOUT)
+    results.update(fetched)
+    return [results.get(key, []) for key in keys]
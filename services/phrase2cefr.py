@@ -4,6 +4,12 @@ from ai.answer_with_llm_old import answer_with_llm
 
 PROMPT_TEMPLATE_PATH = Path(__file__).parent / "prompts" / "phrase2cefr.txt"
 
+# Read once at import rather than on every call.
+try:
+    _PROMPT_TEMPLATE = PROMPT_TEMPLATE_PATH.read_text(encoding="utf-8")
+except OSError:
+    _PROMPT_TEMPLATE = None
+
 
 def phrase2cefr(phrase: str, language: str, client, model="gpt-3.5-turbo") -> str:
     """
@@ -18,8 +24,9 @@ def phrase2cefr(phrase: str, language: str, client, model="gpt-3.5-turbo") -> st
     Returns:
         str: CEFR code ("A1" to "C2")
     """
-    prompt_template = PROMPT_TEMPLATE_PATH.read_text(encoding="utf-8")
-    prompt = prompt_template.format(language=language, phrase=phrase)
+    if _PROMPT_TEMPLATE is None:
+        raise FileNotFoundError(f"Prompt template not found: {PROMPT_TEMPLATE_PATH}")
+    prompt = _PROMPT_TEMPLATE.format(language=language, phrase=phrase)
 
     response = answer_with_llm(
         prompt=prompt,
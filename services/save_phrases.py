@@ -1,6 +1,13 @@
 # services/save_phrases.py
-import json
 import logging
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+
+from ai.answer_with_llm import is_complete_json
 from learning.models import Phrase, LexicalUnit, PhraseTranslation
 
 logger = logging.getLogger(__name__)
@@ -18,11 +25,18 @@ def parse_and_save_phrases(
     """
     created_count = 0
     if not raw_response:
-        logger.warning(f"Received empty response for '{lexical_unit.lemma}'.")
+        logger.warning("Received empty response for '%s'.", lexical_unit.lemma)
+        return created_count
+    if not is_complete_json(raw_response):
+        logger.warning(
+            "Truncated LLM response for '%s'. Response: %s",
+            lexical_unit.lemma,
+            raw_response,
+        )
         return created_count
 
     try:
-        data = json.loads(raw_response)
+        data = orjson.loads(raw_response)
         phrase_pairs = []
 
         if isinstance(data, dict):
@@ -31,16 +45,18 @@ def parse_and_save_phrases(
             phrase_pairs = data
         else:
             logger.error(
-                f"LLM response is not a list or a dict with a 'phrases' key. Response: {raw_response}"
+                "LLM response is not a list or a dict with a 'phrases' key. Response: %s",
+                raw_response,
             )
             return created_count
 
         if not isinstance(phrase_pairs, list):
             logger.error(
-                f"Data under 'phrases' key is not a list. Response: {raw_response}"
+                "Data under 'phrases' key is not a list. Response: %s", raw_response
             )
             return created_count
 
+        valid_pairs = []
         for item in phrase_pairs:
             original_text = item.get("original_phrase")
             translated_text = item.get("translated_phrase")
@@ -48,43 +64,156 @@ def parse_and_save_phrases(
 
             if not all([original_text, translated_text, cefr]):
                 logger.warning(
-                    f"Skipping phrase pair for '{lexical_unit.lemma}' due to missing data: {item}"
+                    "Skipping phrase pair for '%s' due to missing data: %s",
+                    lexical_unit.lemma,
+                    item,
                 )
                 continue
+            valid_pairs.append((original_text, translated_text, cefr))
 
-            try:
-                phrase_original = Phrase.objects.create(
-                    text=original_text, language=source_language, cefr=cefr
-                )
-                phrase_original.units.add(lexical_unit)
-
-                phrase_translated = Phrase.objects.create(
-                    text=translated_text, language=target_language, cefr=cefr
-                )
-
-                PhraseTranslation.objects.create(
-                    source_phrase=phrase_original, target_phrase=phrase_translated
-                )
-                created_count += 1
-            except Exception as e_inner:
-                logger.error(
-                    f"Failed to save a phrase pair for '{lexical_unit.lemma}': {e_inner}",
-                    exc_info=True,
-                )
+        created_count = _bulk_save_pairs(
+            valid_pairs, lexical_unit, source_language, target_language
+        )
 
         if created_count > 0:
             logger.info(
-                f"Successfully saved {created_count} phrase pairs for '{lexical_unit.lemma}'."
+                "Successfully saved %s phrase pairs for '%s'.",
+                created_count,
+                lexical_unit.lemma,
             )
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error(
-            f"Failed to decode JSON for '{lexical_unit.lemma}'. Response: {raw_response}"
+            "Failed to decode JSON for '%s'. Response: %s",
+            lexical_unit.lemma,
+            raw_response,
         )
     except Exception as e:
         logger.error(
-            f"General failure in parse_and_save_phrases for '{lexical_unit.lemma}': {e}",
+            "General failure in parse_and_save_phrases for '%s': %s",
+            lexical_unit.lemma,
+            e,
             exc_info=True,
         )
 
     return created_count
+
+
+async def parse_and_save_phrases_async(
+    raw_response: str,
+    lexical_unit: LexicalUnit,
+    source_language: str,
+    target_language: str,
+):
+    """
+    Same as parse_and_save_phrases, for async callers such as a pipeline built
+    on unit2phrases_async. The ORM is synchronous, so parsing and the writes
+    run in a worker thread and the event loop keeps serving LLM requests.
+    """
+    return await sync_to_async(parse_and_save_phrases)(
+        raw_response, lexical_unit, source_language, target_language
+    )
+
+
+# The existence check and the INSERT are separate statements, so a
+# concurrent writer can still win the race; one re-check is enough to drop
+# just the colliding pairs.
+SAVE_ATTEMPTS = 2
+
+
+def _bulk_save_pairs(pairs, lexical_unit, source_language, target_language) -> int:
+    """
+    Saves (original, translation, cefr) triples with one INSERT per table
+    instead of three create() calls per pair, all in one transaction. A pair
+    is skipped when either of its phrases already exists, as the per-row
+    IntegrityError did before; a duplicate never aborts the other pairs.
+    """
+    PhraseUnit = Phrase.units.through
+    for attempt in range(1, SAVE_ATTEMPTS + 1):
+        originals, translations = _new_phrase_pairs(
+            pairs, lexical_unit, source_language, target_language
+        )
+        if not originals:
+            return 0
+        try:
+            with transaction.atomic():
+                phrases = Phrase.objects.bulk_create(originals + translations)
+                if not connection.features.can_return_rows_from_bulk_insert:
+                    _load_phrase_ids(phrases)
+                PhraseUnit.objects.bulk_create(
+                    PhraseUnit(phrase_id=phrase.id, lexicalunit_id=lexical_unit.id)
+                    for phrase in originals
+                )
+                PhraseTranslation.objects.bulk_create(
+                    PhraseTranslation(source_phrase=source, target_phrase=target)
+                    for source, target in zip(originals, translations)
+                )
+            break
+        except IntegrityError:
+            if attempt == SAVE_ATTEMPTS:
+                raise
+            logger.warning(
+                "Phrase pairs for '%s' collided with a concurrent insert; retrying.",
+                lexical_unit.lemma,
+            )
+
+    # bulk_create() skips post_save; send it so enrichment still runs for
+    # every new phrase, exactly as it did for create().
+    for phrase in phrases:
+        post_save.send(
+            sender=Phrase,
+            instance=phrase,
+            created=True,
+            update_fields=None,
+            raw=False,
+            using=phrase._state.db,
+        )
+    return len(originals)
+
+
+def _load_phrase_ids(phrases):
+    """
+    Fills in primary keys after bulk_create() on a backend that cannot return
+    them (e.g. SQLite before 3.35), so the link rows can still be built.
+    """
+    rows = Phrase.objects.filter(
+        text__in={phrase.text for phrase in phrases},
+        language__in={phrase.language for phrase in phrases},
+    ).values_list("text", "language", "id")
+    ids = {(text, language): pk for text, language, pk in rows}
+    for phrase in phrases:
+        phrase.pk = ids[(phrase.text, phrase.language)]
+
+
+def _existing_phrase_keys(pairs, source_language, target_language) -> set:
+    return set(
+        Phrase.objects.filter(
+            Q(text__in=[p[0] for p in pairs], language=source_language)
+            | Q(text__in=[p[1] for p in pairs], language=target_language)
+        ).values_list("text", "language")
+    )
+
+
+def _new_phrase_pairs(pairs, lexical_unit, source_language, target_language):
+    """Builds unsaved Phrase objects for every pair that is free to insert."""
+    if not pairs:
+        return [], []
+    taken = _existing_phrase_keys(pairs, source_language, target_language)
+    originals, translations = [], []
+    for original_text, translated_text, cefr in pairs:
+        keys = {(original_text, source_language), (translated_text, target_language)}
+        if len(keys) < 2 or not keys.isdisjoint(taken):
+            logger.warning(
+                "Skipping phrase pair for '%s': phrase already exists: %s",
+                lexical_unit.lemma,
+                original_text,
+            )
+            continue
+        taken |= keys
+        originals.append(
+            Phrase(text=original_text, language=source_language, cefr=cefr)
+        )
+        translations.append(
+            Phrase(text=translated_text, language=target_language, cefr=cefr)
+        )
+    return originals, translations
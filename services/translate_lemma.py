@@ -1,10 +1,23 @@
 # In learning/services/translate_lemma.py
 import logging
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from learning.enums import PartOfSpeech, LexicalCategory
 from learning.models import LexicalUnit
-from ai.answer_with_llm import answer_with_llm
+from ai.answer_with_llm import (
+    answer_with_llm,
+    answer_with_llm_async,
+    is_complete_json,
+)
+from ai.cache import (
+    LLM_CACHE_TIMEOUT,
+    aget_cached,
+    get_cached,
+    llm_cache,
+    llm_cache_key,
+    prompt_version,
+    single_flight,
+)
 from ai.get_prompt import get_templated_messages
 
 logger = logging.getLogger(__name__)
@@ -22,6 +35,12 @@ class TranslationResponse(BaseModel):
     translation_details: List[TranslationDetail]
 
 
+# Invariant for the process lifetime, so built once at import.
+_TRANSLATION_SCHEMA = TranslationResponse.model_json_schema()
+_POS_LIST = ", ".join(pos.value for pos in PartOfSpeech)
+_LEXCAT_LIST = ", ".join(cat.value for cat in LexicalCategory)
+
+
 _SYSTEM_PROMPT = """
 You are an expert translator. The source lexical unit is "{source_lemma}".
 It is a {source_lexical_category} and its primary part of speech is {source_pos} in its original language, "{source_language_code}".
@@ -35,6 +54,83 @@ For the most common translation, provide all its distinct structural types (`lex
 -   You MUST respond ONLY with a valid JSON object.
 """
 
+# The enum lists never change, so they are substituted once here.
+_PREPARED_SYSTEM_PROMPT = _SYSTEM_PROMPT.replace(
+    "{lexical_category_enum_list}", _LEXCAT_LIST
+).replace("{pos_enum_values_list}", _POS_LIST)
+
+
+_LLM_OPTIONS = {
+    "model": "meta-llama/Llama-3.3-70B-Instruct",
+    "extra_body": {"guided_json": _TRANSLATION_SCHEMA},
+    "prettify": False,
+    "temperature": 0.2,
+}
+
+_PROMPT_VERSION = prompt_version(_PREPARED_SYSTEM_PROMPT, _TRANSLATION_SCHEMA)
+
+
+def _translation_messages(source_lu: LexicalUnit, target_language_code: str) -> list:
+    params = {
+        "source_lemma": source_lu.lemma,
+        "source_lexical_category": source_lu.get_lexical_category_display(),  # <-- Добавили для контекста
+        "source_pos": source_lu.get_part_of_speech_display(),
+        "source_language_code": source_lu.language,
+        "target_language_code": target_language_code,
+    }
+    return get_templated_messages(
+        system_prompt=_PREPARED_SYSTEM_PROMPT, user_prompt="", params=params
+    )
+
+
+def _cache_key(source_lu: LexicalUnit, target_language_code: str) -> str:
+    # Everything the prompt is built from, so equal keys mean equal prompts.
+    return llm_cache_key(
+        "translation",
+        _PROMPT_VERSION,
+        _LLM_OPTIONS["model"],
+        source_lu.language,
+        source_lu.lemma,
+        source_lu.lexical_category,
+        source_lu.part_of_speech,
+        target_language_code,
+    )
+
+
+def _parse_translation(
+    source_lu: LexicalUnit, response_str: str
+) -> Optional[TranslationResponse]:
+    """Validates a reply; shared by the sync and async paths."""
+    if not is_complete_json(response_str):
+        logger.warning("Truncated LLM response for '%s'.", source_lu.lemma)
+        return None
+    try:
+        return TranslationResponse.model_validate_json(response_str)
+    except ValidationError as e:
+        _log_failure(source_lu, e)
+        return None
+
+
+def _log_failure(source_lu: LexicalUnit, exc: Exception) -> None:
+    # LLM failures are routine; only pay for the traceback at DEBUG.
+    logger.error(
+        "LLM call or parsing failed during translation of '%s': %s",
+        source_lu.lemma,
+        exc,
+        exc_info=logger.isEnabledFor(logging.DEBUG),
+    )
+
+
+def _has_pos(source_lu: LexicalUnit) -> bool:
+    if not source_lu.part_of_speech:
+        logger.warning(
+            "Cannot translate LU %s ('%s') because its POS is not specified.",
+            source_lu.id,
+            source_lu.lemma,
+        )
+        return False
+    return True
+
 
 def translate_lemma_with_details(
     client, source_lu: LexicalUnit, target_language_code: str
@@ -43,46 +139,62 @@ def translate_lemma_with_details(
     Calls an LLM to translate a given LexicalUnit and get details for the translation,
     using a Pydantic model for guaranteed JSON structure.
     """
-    if not source_lu.part_of_speech:
-        logger.warning(
-            f"Cannot translate LU {source_lu.id} ('{source_lu.lemma}') because its POS is not specified."
-        )
+    if not _has_pos(source_lu):
         return None
 
+    key = _cache_key(source_lu, target_language_code)
+    translation = get_cached(key, TranslationResponse.model_validate)
+    if translation is not None:
+        return translation
     try:
-        pos_enum_list = ", ".join([pos.value for pos in PartOfSpeech])
-        # +++ Получаем список лексических категорий
-        lexical_category_enum_list = ", ".join([cat.value for cat in LexicalCategory])
-
-        params = {
-            "source_lemma": source_lu.lemma,
-            "source_lexical_category": source_lu.get_lexical_category_display(),  # <-- Добавили для контекста
-            "source_pos": source_lu.get_part_of_speech_display(),
-            "source_language_code": source_lu.language,
-            "target_language_code": target_language_code,
-            "pos_enum_values_list": pos_enum_list,
-            "lexical_category_enum_list": lexical_category_enum_list,  # <-- Передаем в промпт
-        }
-
-        # 2. Логика чтения файла заменена на использование переменной
-        messages = get_templated_messages(
-            system_prompt=_SYSTEM_PROMPT, user_prompt="", params=params
-        )
-
         response_str = answer_with_llm(
             client=client,
-            messages=messages,
-            model="meta-llama/Llama-3.3-70B-Instruct",
-            extra_body={"guided_json": TranslationResponse.model_json_schema()},
-            prettify=False,
-            temperature=0.2,
+            messages=_translation_messages(source_lu, target_language_code),
+            **_LLM_OPTIONS,
         )
+    except Exception as e:
+        _log_failure(source_lu, e)
+        return None
+    translation = _parse_translation(source_lu, response_str)
+    if translation is not None:
+        llm_cache.set(key, translation.model_dump(mode="json"), LLM_CACHE_TIMEOUT)
+    return translation
 
-        return TranslationResponse.model_validate_json(response_str)
 
-    except Exception as e:
-        logger.error(
-            f"LLM call or parsing failed during translation of '{source_lu.lemma}': {e}",
-            exc_info=True,
+async def translate_lemma_with_details_async(
+    client, source_lu: LexicalUnit, target_language_code: str
+) -> Optional[TranslationResponse]:
+    """
+    Same as translate_lemma_with_details, for an AsyncOpenAI client. Run many
+    through ai.answer_with_llm.gather_with_limit.
+    """
+    if not _has_pos(source_lu):
+        return None
+
+    key = _cache_key(source_lu, target_language_code)
+    return await single_flight(
+        key, lambda: _translate_async(client, source_lu, target_language_code, key)
+    )
+
+
+async def _translate_async(
+    client, source_lu: LexicalUnit, target_language_code: str, key: str
+) -> Optional[TranslationResponse]:
+    translation = await aget_cached(key, TranslationResponse.model_validate)
+    if translation is not None:
+        return translation
+    try:
+        response_str = await answer_with_llm_async(
+            client=client,
+            messages=_translation_messages(source_lu, target_language_code),
+            **_LLM_OPTIONS,
         )
+    except Exception as e:
+        _log_failure(source_lu, e)
         return None
+    translation = _parse_translation(source_lu, response_str)
+    if translation is not None:
+        await llm_cache.aset(
+            key, translation.model_dump(mode="json"), LLM_CACHE_TIMEOUT
+        )
+    return translation
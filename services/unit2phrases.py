@@ -1,9 +1,10 @@
 # services/unit2phrases.py
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from pydantic import BaseModel, Field
 
-from ai.answer_with_llm import answer_with_llm
+from ai.answer_with_llm import answer_with_llm, answer_with_llm_async
 from ai.get_prompt import get_templated_messages
 from learning.enums import CEFR
 
@@ -11,6 +12,9 @@ logger = logging.getLogger(__name__)
 
 MODEL = "deepseek-ai/DeepSeek-V3-0324"
 
+# Requests submitted at once by unit2phrases_batch.
+MAX_CONCURRENCY = 16
+
 
 class PhrasePair(BaseModel):
     original_phrase: str = Field(
@@ -24,6 +28,9 @@ class PhraseListResponse(BaseModel):
     phrases: List[PhrasePair]
 
 
+_PHRASE_LIST_SCHEMA = PhraseListResponse.model_json_schema()
+
+
 _SYSTEM_PROMPT = """
 You are a language expert. Your task is to generate example sentences for: "{lemma}"
 
@@ -43,6 +50,28 @@ Each object must have these exact keys: "original_phrase", "translated_phrase",
 """
 
 
+_LLM_OPTIONS = {
+    # "model": "meta-llama/Llama-3.3-70B-Instruct",
+    "model": MODEL,
+    "extra_body": {"guided_json": _PHRASE_LIST_SCHEMA},
+    "prettify": False,
+    "temperature": 0.7,
+}
+
+
+def _phrase_messages(lemma, cefr, source_language, target_language, n) -> list:
+    params = {
+        "lemma": lemma,
+        "n": n,
+        "cefr": cefr,
+        "source_language": source_language,
+        "target_language": target_language,
+    }
+    return get_templated_messages(
+        system_prompt=_SYSTEM_PROMPT, user_prompt="", params=params
+    )
+
+
 def unit2phrases(
     client,
     lemma: str,
@@ -56,30 +85,69 @@ def unit2phrases(
     Uses standardised 'source_language' and 'target_language' parameters.
     """
     try:
-        params = {
-            "lemma": lemma,
-            "n": n,
-            "cefr": cefr,
-            "source_language": source_language,
-            "target_language": target_language,
-        }
-
-        messages = get_templated_messages(
-            system_prompt=_SYSTEM_PROMPT, user_prompt="", params=params
-        )
-
         response_str = answer_with_llm(
             client=client,
-            messages=messages,
-            # model="meta-llama/Llama-3.3-70B-Instruct",
-            model=MODEL,
-            extra_body={"guided_json": PhraseListResponse.model_json_schema()},
-            prettify=False,
-            temperature=0.7,
+            messages=_phrase_messages(lemma, cefr, source_language, target_language, n),
+            **_LLM_OPTIONS,
         )
 
         return response_str
 
     except Exception as e:
-        logger.error(f"Failed to generate phrases for '{lemma}': {e}", exc_info=True)
+        logger.error("Failed to generate phrases for '%s': %s", lemma, e, exc_info=True)
+        return None
+
+
+def unit2phrases_batch(
+    client,
+    lemmas: List[str],
+    cefr: str,
+    source_language: str,
+    target_language: str,
+    n: int = 5,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> List[str | None]:
+    """
+    Generates phrases for many lemmas. Chat completions take one conversation
+    per request, so the requests are submitted together from a thread pool and
+    the inference server batches them itself. Results are aligned with
+    `lemmas`; a failed lemma yields None, as in unit2phrases.
+    """
+    if len(lemmas) <= 1:
+        return [
+            unit2phrases(client, lemma, cefr, source_language, target_language, n)
+            for lemma in lemmas
+        ]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(lemmas))) as pool:
+        return list(
+            pool.map(
+                lambda lemma: unit2phrases(
+                    client, lemma, cefr, source_language, target_language, n
+                ),
+                lemmas,
+            )
+        )
+
+
+async def unit2phrases_async(
+    client,
+    lemma: str,
+    cefr: str,
+    source_language: str,
+    target_language: str,
+    n: int = 5,
+) -> str | None:
+    """
+    Same as unit2phrases, for an AsyncOpenAI client. Run many through
+    ai.answer_with_llm.gather_with_limit.
+    """
+    try:
+        return await answer_with_llm_async(
+            client=client,
+            messages=_phrase_messages(lemma, cefr, source_language, target_language, n),
+            **_LLM_OPTIONS,
+        )
+
+    except Exception as e:
+        logger.error("Failed to generate phrases for '%s': %s", lemma, e, exc_info=True)
         return None
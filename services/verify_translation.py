@@ -1,10 +1,24 @@
 # In learning/services/verify_translation.py
 
 import logging
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from typing import Optional
 
-from ai.answer_with_llm import answer_with_llm
+
+from ai.answer_with_llm import (
+    answer_with_llm,
+    answer_with_llm_async,
+    is_complete_json,
+)
+from ai.cache import (
+    LLM_CACHE_TIMEOUT,
+    aget_cached,
+    get_cached,
+    llm_cache,
+    llm_cache_key,
+    prompt_version,
+    single_flight,
+)
 from ai.get_prompt import get_templated_messages
 from learning.models import LexicalUnit
 
@@ -19,6 +33,9 @@ class TranslationQualityResponse(BaseModel):
     justification: str = Field(..., description="A brief justification for the score.")
 
 
+_QUALITY_SCHEMA = TranslationQualityResponse.model_json_schema()
+
+
 # 2. Определяем промпты
 _SYSTEM_PROMPT = (
     "You are a translation quality evaluator. You will be given a source word "
@@ -35,6 +52,67 @@ _USER_PROMPT = (
 )
 
 
+_LLM_OPTIONS = {
+    "model": "meta-llama/Llama-3.3-70B-Instruct",
+    "extra_body": {"guided_json": _QUALITY_SCHEMA},
+    "prettify": False,
+}
+
+_PROMPT_VERSION = prompt_version(_SYSTEM_PROMPT, _USER_PROMPT, _QUALITY_SCHEMA)
+
+
+def _verification_messages(source_unit: LexicalUnit, target_unit: LexicalUnit):
+    params = {
+        "source_language": source_unit.language,
+        "source_lemma": source_unit.lemma,
+        "source_lexical_category": source_unit.get_lexical_category_display(),  # <-- Передаем в промпт
+        "source_pos": source_unit.part_of_speech,
+        "target_language": target_unit.language,
+        "target_lemma": target_unit.lemma,
+    }
+    return get_templated_messages(_SYSTEM_PROMPT, _USER_PROMPT, params)
+
+
+def _cache_key(source_unit: LexicalUnit, target_unit: LexicalUnit) -> str:
+    # Everything the prompt is built from, so equal keys mean equal prompts.
+    return llm_cache_key(
+        "verification",
+        _PROMPT_VERSION,
+        _LLM_OPTIONS["model"],
+        source_unit.language,
+        source_unit.lemma,
+        source_unit.lexical_category,
+        source_unit.part_of_speech,
+        target_unit.language,
+        target_unit.lemma,
+    )
+
+
+def _parse_verification(
+    source_unit: LexicalUnit, response_str: str
+) -> Optional[TranslationQualityResponse]:
+    """Validates a reply; shared by the sync and async paths."""
+    if not is_complete_json(response_str):
+        logger.warning(
+            "Truncated LLM response for verification of '%s'.", source_unit.lemma
+        )
+        return None
+    try:
+        return TranslationQualityResponse.model_validate_json(response_str)
+    except ValidationError as e:
+        _log_failure(e)
+        return None
+
+
+def _log_failure(exc: Exception) -> None:
+    # LLM failures are routine; only pay for the traceback at DEBUG.
+    logger.error(
+        "LLM call for translation verification failed: %s",
+        exc,
+        exc_info=logger.isEnabledFor(logging.DEBUG),
+    )
+
+
 # 3. Создаем основную сервисную функцию
 def get_translation_verification(
     client, source_unit: LexicalUnit, target_unit: LexicalUnit
@@ -50,30 +128,56 @@ def get_translation_verification(
     Returns:
         A Pydantic object with the verification result, or None on failure.
     """
-    params = {
-        "source_language": source_unit.language,
-        "source_lemma": source_unit.lemma,
-        "source_lexical_category": source_unit.get_lexical_category_display(),  # <-- Передаем в промпт
-        "source_pos": source_unit.part_of_speech,
-        "target_language": target_unit.language,
-        "target_lemma": target_unit.lemma,
-    }
-
+    key = _cache_key(source_unit, target_unit)
+    verification = get_cached(key, TranslationQualityResponse.model_validate)
+    if verification is not None:
+        return verification
     try:
-        messages = get_templated_messages(_SYSTEM_PROMPT, _USER_PROMPT, params)
-
         response_str = answer_with_llm(
             client=client,
-            messages=messages,
-            model="meta-llama/Llama-3.3-70B-Instruct",
-            extra_body={"guided_json": TranslationQualityResponse.model_json_schema()},
-            prettify=False,
+            messages=_verification_messages(source_unit, target_unit),
+            **_LLM_OPTIONS,
         )
+    except Exception as e:
+        _log_failure(e)
+        return None
+    verification = _parse_verification(source_unit, response_str)
+    if verification is not None:
+        llm_cache.set(key, verification.model_dump(mode="json"), LLM_CACHE_TIMEOUT)
+    return verification
 
-        return TranslationQualityResponse.model_validate_json(response_str)
 
-    except Exception as e:
-        logger.error(
-            f"LLM call for translation verification failed: {e}", exc_info=True
+async def get_translation_verification_async(
+    client, source_unit: LexicalUnit, target_unit: LexicalUnit
+) -> Optional[TranslationQualityResponse]:
+    """
+    Same as get_translation_verification, for an AsyncOpenAI client. Run many
+    through ai.answer_with_llm.gather_with_limit.
+    """
+    key = _cache_key(source_unit, target_unit)
+    return await single_flight(
+        key, lambda: _verify_async(client, source_unit, target_unit, key)
+    )
+
+
+async def _verify_async(
+    client, source_unit: LexicalUnit, target_unit: LexicalUnit, key: str
+) -> Optional[TranslationQualityResponse]:
+    verification = await aget_cached(key, TranslationQualityResponse.model_validate)
+    if verification is not None:
+        return verification
+    try:
+        response_str = await answer_with_llm_async(
+            client=client,
+            messages=_verification_messages(source_unit, target_unit),
+            **_LLM_OPTIONS,
         )
+    except Exception as e:
+        _log_failure(e)
         return None
+    verification = _parse_verification(source_unit, response_str)
+    if verification is not None:
+        await llm_cache.aset(
+            key, verification.model_dump(mode="json"), LLM_CACHE_TIMEOUT
+        )
+    return verification
@@ -9,13 +9,17 @@ def prettify_string(text, max_line_length=80):
     output_lines = []
     lines = text.split("\n")
     for line in lines:
-        current_line = ""
-        words = line.split()
-        for word in words:
-            if len(current_line) + len(word) + 1 <= max_line_length:
-                current_line += word + " "
+        # Collect the words of each output line and join them once, instead of
+        # growing a string word by word. `length` counts a space after each word.
+        current_words = []
+        length = 0
+        for word in line.split():
+            if length + len(word) + 1 <= max_line_length:
+                current_words.append(word)
+                length += len(word) + 1
             else:
-                output_lines.append(current_line.strip())
-                current_line = word + " "
-        output_lines.append(current_line.strip())  # Append the last line
+                output_lines.append(" ".join(current_words))
+                current_words = [word]
+                length = len(word) + 1
+        output_lines.append(" ".join(current_words))  # Append the last line
     return "\n".join(output_lines)